@@ -3,14 +3,88 @@
 import os
 import re
 import shutil
+import signal
+import stat
+import subprocess
+import sys
 import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
 from .colors import Colors
-from .git import Git
+from .git import Git, GitError, kill_process_group
 from .logging_setup import setup_logging
 
+# Run by `git bisect run` as `sh -c <shim> <test_script>` from the top of the
+# work tree; the test script receives the commit being tested and the work dir.
+_TEST_SCRIPT_SHIM = 'exec "$0" "$(git rev-parse HEAD)" "$PWD"'
+
+# Line printed by `git bisect run` when it finds the first bad commit
+_FIRST_BAD_LINE_RE = re.compile(r"([0-9a-f]{40}) is the first bad commit$")
+
+# Line recorded in `git bisect log` once the first bad commit is found
+_FIRST_BAD_RE = re.compile(r"# first bad commit: \[([0-9a-f]{40})\]")
+
+
+def _find_first_bad(bisect_log: str) -> Optional[str]:
+    """Find the first bad commit recorded in a bisect log.
+
+    The result is the last thing git writes to the log, so it is searched
+    for from the end.
+    """
+    start = bisect_log.rfind("# first bad commit: ")
+    if start == -1:
+        return None
+    match = _FIRST_BAD_RE.match(bisect_log, start)
+    return match.group(1) if match else None
+
+
+# Signals that would kill the tool without running its cleanup. git bisect
+# and the test scripts run in their own sessions and would not see them.
+_EXIT_SIGNALS = (signal.SIGTERM, signal.SIGHUP)
+
+
+def _exit_on_signal(signum, frame):
+    """Raise SystemExit, with the shell's 128+N status, so cleanup runs."""
+    raise SystemExit(128 + signum)
+
+
+def _banner(title: str, color: str) -> str:
+    """Build a framed banner block in the given color."""
+    rule = "=" * 62
+    return f"{Colors.BOLD}{color}{rule}\n  {title}\n{rule}{Colors.RESET}"
+
+
+def _estimate_steps(count: int) -> int:
+    """Estimate the bisect steps for a range, as ``git bisect`` reports it.
+
+    Mirrors ``estimate_bisect_steps()`` in git's bisect.c.
+
+    Args:
+        count: Number of commits in the good..bad range.
+    """
+    if count < 3:
+        return 0
+    n = count.bit_length() - 1
+    e = 1 << n
+    return n if e < 3 * (count - e) else n - 1
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it cannot be reached."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _write_lines(lines: list[str]):
+    """Write a block of lines to stdout with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 class BisectRunner:
     """Main bisect orchestration class.
@@ -33,6 +107,7 @@ class BisectRunner:
         show_ancestry: bool = False,
         dry_run: bool = False,
         verbose: bool = False,
+        jobs: int = 1,
     ):
         """Initialize the bisect runner.
 
@@ -46,6 +121,8 @@ class BisectRunner:
             show_ancestry: Whether to show merge ancestry of found commit.
             dry_run: If True, show config without running.
             verbose: If True, enable verbose logging.
+            jobs: Number of commits to test in parallel. Values above 1
+                use one worktree per job and imply use_worktree.
         """
         self.logger = setup_logging(verbose)
         self.verbose = verbose
@@ -57,61 +134,80 @@ class BisectRunner:
         self.branch = branch if branch else self.git.get_current_branch()
 
         # Resolve commits to full hashes
-        self.good_commit = self.git.get_commit_hash(good_commit)
-        self.bad_commit = self.git.get_commit_hash(bad_commit)
+        self.good_commit, self.bad_commit = self.git.resolve_refs(
+            good_commit, bad_commit
+        )
 
         self.test_script = Path(test_script).resolve()
-        self.use_worktree = use_worktree
+        self._bisect_cmd = ["sh", "-c", _TEST_SCRIPT_SHIM, str(self.test_script)]
+        self.jobs = jobs
+        self.use_worktree = use_worktree or jobs > 1
         self.show_ancestry = show_ancestry
         self.dry_run = dry_run
 
         self.worktree_path: Optional[Path] = None
+        self.extra_worktree_paths: list[Path] = []
         self.temp_dir: Optional[Path] = None
+        self._worktree_futures: list[Future] = []
+        self._found_bad: Optional[str] = None
+        self._range_counts: Optional[tuple[int, int]] = None
+
+        # Test scripts running in parallel mode, by commit
+        self._tests: dict[str, subprocess.Popen] = {}
+        self._tests_lock = threading.Lock()
+        self._abandoned: set[str] = set()
 
     def print_banner(self):
         """Print a nice banner."""
-        print(
-            f"\n{Colors.BOLD}{Colors.CYAN}"
-            f"{'=' * 62}\n"
-            f"  Git Bisect Tool\n"
-            f"{'=' * 62}"
-            f"{Colors.RESET}\n",
-            flush=True,
-        )
+        _write_lines(["", _banner("Git Bisect Tool", Colors.CYAN), ""])
 
     def print_config(self):
         """Print the configuration."""
         good_info = self.git.get_commit_info(self.good_commit)
         bad_info = self.git.get_commit_info(self.bad_commit)
 
-        print(f"{Colors.BOLD}Configuration:{Colors.RESET}")
-        print(f"  Repository:   {Colors.WHITE}{self.repo_path}{Colors.RESET}")
-        print(f"  Branch:       {Colors.MAGENTA}{self.branch}{Colors.RESET}")
-        print(
+        lines = [
+            f"{Colors.BOLD}Configuration:{Colors.RESET}",
+            f"  Repository:   {Colors.WHITE}{self.repo_path}{Colors.RESET}",
+            f"  Branch:       {Colors.MAGENTA}{self.branch}{Colors.RESET}",
             f"  Good commit:  {Colors.GREEN}{good_info['short_hash']}{Colors.RESET}"
-            f" - {good_info['subject'][:50]}"
-        )
-        print(
+            f" - {good_info['subject'][:50]}",
             f"  Bad commit:   {Colors.RED}{bad_info['short_hash']}{Colors.RESET}"
-            f" - {bad_info['subject'][:50]}"
-        )
-        print(f"  Test script:  {Colors.WHITE}{self.test_script}{Colors.RESET}")
-        print(
+            f" - {bad_info['subject'][:50]}",
+            f"  Test script:  {Colors.WHITE}{self.test_script}{Colors.RESET}",
             f"  Use worktree: "
-            f"{Colors.YELLOW}{'Yes' if self.use_worktree else 'No'}{Colors.RESET}"
-        )
-        print(flush=True)
+            f"{Colors.YELLOW}{'Yes' if self.use_worktree else 'No'}{Colors.RESET}",
+        ]
+        if self.jobs > 1:
+            lines.append(f"  Jobs:         {Colors.YELLOW}{self.jobs}{Colors.RESET}")
+        lines.append("")
+        _write_lines(lines)
 
-    def print_estimate(self):
-        """Print git bisect's own estimated number of steps."""
-        steps = self.git.bisect_estimate(self.bad_commit, self.good_commit)
+    def _get_range_counts(self) -> tuple[int, int]:
+        """Get the commit counts on each side of good...bad, fetched once.
 
-        print(f"{Colors.BOLD}Bisect Estimate:{Colors.RESET}")
-        if steps is not None:
-            print(f"  From git bisect: {Colors.CYAN}~{steps}{Colors.RESET}")
-        else:
-            print(f"  From git bisect: {Colors.CYAN}unknown{Colors.RESET}")
-        print(flush=True)
+        Returns:
+            Commits only reachable from good, and commits only reachable
+            from bad.
+        """
+        if self._range_counts is None:
+            self._range_counts = self.git.count_left_right(
+                self.good_commit, self.bad_commit
+            )
+        return self._range_counts
+
+    def print_estimate(self):
+        """Print the number of steps git bisect is expected to take."""
+        _, commit_count = self._get_range_counts()
+
+        estimate = f"~{_estimate_steps(commit_count)}"
+        _write_lines(
+            [
+                f"{Colors.BOLD}Bisect Estimate:{Colors.RESET}",
+                f"  From git bisect: {Colors.CYAN}{estimate}{Colors.RESET}",
+                "",
+            ]
+        )
 
     def validate(self) -> bool:
         """Validate the configuration before starting.
@@ -121,17 +217,19 @@ class BisectRunner:
         """
         self.logger.info("Validating configuration...")
 
-        # Check if repo exists
-        if not self.repo_path.is_dir():
-            self.logger.error("Repository not found: %s", self.repo_path)
-            return False
-
-        if not (self.repo_path / ".git").is_dir():
-            self.logger.error("Not a git repository: %s", self.repo_path)
+        # Stat .git first: if it exists, so does the repository. A linked
+        # worktree has a .git file rather than a directory.
+        if _stat(self.repo_path / ".git") is None:
+            repo_st = _stat(self.repo_path)
+            if repo_st is None or not stat.S_ISDIR(repo_st.st_mode):
+                self.logger.error("Repository not found: %s", self.repo_path)
+            else:
+                self.logger.error("Not a git repository: %s", self.repo_path)
             return False
 
         # Check if test script exists and is executable
-        if not self.test_script.is_file():
+        script_st = _stat(self.test_script)
+        if script_st is None or not stat.S_ISREG(script_st.st_mode):
             self.logger.error("Test script not found: %s", self.test_script)
             return False
 
@@ -140,8 +238,11 @@ class BisectRunner:
             self.logger.warning("Attempting to make it executable...")
             self.test_script.chmod(0o755)
 
+        # One rev-list answers both the ancestry and the commit count checks
+        good_only, commit_count = self._get_range_counts()
+
         # Check if good is ancestor of bad
-        if not self.git.is_ancestor(self.good_commit, self.bad_commit):
+        if good_only:
             self.logger.error("Good commit is not an ancestor of bad commit!")
             self.logger.error(
                 "Make sure good commit comes before bad commit in history."
@@ -149,7 +250,6 @@ class BisectRunner:
             return False
 
         # Check commit count
-        commit_count = self.git.count_commits_between(self.good_commit, self.bad_commit)
         if commit_count == 0:
             self.logger.error("No commits between good and bad commits!")
             return False
@@ -158,27 +258,110 @@ class BisectRunner:
         return True
 
     def setup_worktree(self) -> Path:
-        """Set up a temporary worktree for isolated testing.
+        """Set up temporary worktrees for isolated testing.
+
+        Creates one worktree per job and waits until they all exist.
 
         Returns:
-            Path to the created worktree.
+            Path to the main worktree.
+        """
+        self.start_worktree_setup()
+        self.wait_for_worktrees()
+        return self.worktree_path
+
+    def start_worktree_setup(self) -> list[Future]:
+        """Start creating the temporary worktrees in the background.
+
+        Worktree creation can take seconds on large repositories, so it is
+        started early and overlapped with validation. Call
+        ``wait_for_worktrees()`` before using the worktrees.
+
+        Returns:
+            Futures for the worktree creations.
         """
         self.temp_dir = Path(tempfile.mkdtemp(prefix="git-bisect-"))
         self.worktree_path = self.temp_dir / "worktree"
+        self.extra_worktree_paths = [
+            self.temp_dir / f"worktree-{i}" for i in range(1, self.jobs)
+        ]
 
-        self.logger.info("Creating worktree at: %s", self.worktree_path)
-        self.git.create_worktree(str(self.worktree_path), self.bad_commit)
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        for path in [self.worktree_path, *self.extra_worktree_paths]:
+            self.logger.info("Creating worktree at: %s", path)
+            self._worktree_futures.append(executor.submit(self._create_worktree, path))
+        executor.shutdown(wait=False)
 
-        return self.worktree_path
+        return self._worktree_futures
+
+    def _create_worktree(self, path: Path):
+        """Create a worktree at the bad commit and initialize its submodules.
+
+        Only submodules checked out in the main repository are initialized,
+        matching what the test sees there. They borrow objects from those
+        checkouts via ``--reference`` so they are not fetched again for every
+        worktree.
+
+        Args:
+            path: Where to create the worktree.
+        """
+        self.git.create_worktree(str(path), self.bad_commit)
+
+        if not (path / ".gitmodules").is_file():
+            return
+
+        for submodule in self.git.get_submodule_paths(cwd=str(path)):
+            reference = self.repo_path / submodule
+            if not (reference / ".git").exists():
+                continue
+            try:
+                self.git.init_submodule(
+                    submodule, reference=str(reference), cwd=str(path)
+                )
+            except GitError as e:
+                # The reference may lack objects the superproject needs
+                self.logger.debug(
+                    "Could not initialize submodule %s from %s: %s",
+                    submodule,
+                    reference,
+                    e,
+                )
+                try:
+                    self.git.init_submodule(submodule, cwd=str(path))
+                except GitError as e:
+                    self.logger.warning(
+                        "Could not initialize submodule %s: %s", submodule, e
+                    )
+
+    def wait_for_worktrees(self):
+        """Wait for background worktree creation to finish.
+
+        Raises:
+            GitError: If a worktree could not be created.
+        """
+        for future in self._worktree_futures:
+            future.result()
 
     def cleanup_worktree(self):
-        """Clean up the temporary worktree."""
-        if self.worktree_path and self.worktree_path.exists():
+        """Clean up the temporary worktrees."""
+        # Let any in-flight creation finish so nothing is left behind
+        wait(self._worktree_futures)
+
+        worktrees = [self.worktree_path, *self.extra_worktree_paths]
+        existing = [str(path) for path in worktrees if path and path.exists()]
+        if existing:
             self.logger.info("Cleaning up worktree...")
-            self.git.remove_worktree(str(self.worktree_path))
+            # Each worktree has its own admin dir, so they can be removed
+            # side by side; wait for all of them before clearing temp_dir
+            with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+                list(executor.map(self.git.remove_worktree, existing))
 
+        # git worktree remove has already deleted the checkouts, so the
+        # temp dir is normally empty; only walk it if something was left
         if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            try:
+                os.rmdir(self.temp_dir)
+            except OSError:
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def run_bisect(self) -> Optional[str]:
         """Run the bisect process.
@@ -188,9 +371,6 @@ class BisectRunner:
         """
         work_dir = str(self.worktree_path) if self.use_worktree else str(self.repo_path)
 
-        # Create wrapper script for git bisect run
-        wrapper_script = self._create_wrapper_script()
-
         try:
             # Start bisect
             self.logger.info("Starting git bisect...")
@@ -200,54 +380,189 @@ class BisectRunner:
             self.logger.info("Running bisect with test script...")
             print()  # Blank line for readability
 
-            self.git.run(
+            # Hand the test script to git directly through an inline sh shim
+            # that supplies the commit hash and work dir as arguments. The
+            # output is scanned as it streams past for git's verdict.
+            self._found_bad = None
+            returncode = self.git.run_streaming(
                 "bisect",
                 "run",
-                wrapper_script,
+                *self._bisect_cmd,
+                on_line=self._scan_bisect_line,
                 cwd=work_dir,
-                capture_output=False,
-                check=False,
             )
 
-            # Get the result from bisect log
-            log_result = self.git.run("bisect", "log", cwd=work_dir, check=False)
+            # A failed run (script abort, only skipped commits left) has no
+            # result anywhere, so don't go looking for one.
+            if returncode != 0:
+                self.logger.error("git bisect run exited with code %d", returncode)
+                return None
 
-            # Parse the bad commit from bisect log
-            bad_commit = None
-            for line in (log_result.stdout or "").split("\n"):
-                if "is the first bad commit" in line:
-                    match = re.search(r"([a-f0-9]{40})", line)
-                    if match:
-                        bad_commit = match.group(1)
-                        break
+            if self._found_bad:
+                return self._found_bad
+
+            # After a successful run, refs/bisect/bad is the first bad commit
+            bad_commit = self.git.get_bisect_bad(cwd=work_dir)
+            if bad_commit is None:
+                # Fall back to the result recorded in the bisect log
+                log_result = self.git.run("bisect", "log", cwd=work_dir, check=False)
+                bad_commit = _find_first_bad(log_result.stdout or "")
 
             return bad_commit
 
         finally:
-            # Clean up wrapper script
-            wrapper = Path(wrapper_script)
-            if wrapper.exists():
-                wrapper.unlink()
-
             # Reset bisect
             self.git.bisect_reset(cwd=work_dir)
 
-    def _create_wrapper_script(self) -> str:
-        """Create a wrapper script for git bisect run.
+    def _scan_bisect_line(self, line: str):
+        """Record the first bad commit when git announces it.
+
+        Args:
+            line: A line of `git bisect run` output.
+        """
+        match = _FIRST_BAD_LINE_RE.match(line)
+        if match:
+            self._found_bad = match.group(1)
+
+    def run_bisect_parallel(self) -> Optional[str]:
+        """Run the bisect process, testing several commits at a time.
+
+        Up to ``jobs`` evenly spaced commits from the remaining range are
+        tested concurrently in separate worktrees. As soon as any test
+        finishes the range is narrowed, the same way ``git bisect`` would
+        after marking that commit, tests of commits that fell out of the
+        range are stopped, and the freed worktrees pick up new commits.
 
         Returns:
-            Path to the created wrapper script.
+            The bad commit hash if found, None otherwise.
         """
-        wrapper_content = (
-            "#!/bin/bash\n"
-            "COMMIT=$(git rev-parse HEAD)\n"
-            f'exec "{self.test_script}" "$COMMIT" "$(pwd)"\n'
-        )
-        parent = self.temp_dir if self.temp_dir else Path(tempfile.gettempdir())
-        wrapper_path = parent / "bisect_wrapper.sh"
-        wrapper_path.write_text(wrapper_content)
-        wrapper_path.chmod(0o755)
-        return str(wrapper_path)
+        free_dirs = [
+            str(path) for path in [self.worktree_path, *self.extra_worktree_paths]
+        ]
+        bad = self.bad_commit
+        goods = [self.good_commit]
+        skipped: set[str] = set()
+        running: dict[Future, tuple[str, str]] = {}
+        self._abandoned = set()
+
+        self.logger.info("Running parallel bisect with %d jobs...", self.jobs)
+        print()  # Blank line for readability
+
+        with ThreadPoolExecutor(max_workers=len(free_dirs)) as executor:
+            try:
+                while True:
+                    candidates = [
+                        c for c in self.git.list_commits(bad, goods) if c != bad
+                    ]
+                    position = {c: i for i, c in enumerate(candidates)}
+
+                    # Results for commits outside the range are no longer
+                    # needed, so don't wait for them.
+                    for commit, _ in running.values():
+                        if commit not in position:
+                            self._abandon_test(commit)
+
+                    if not candidates:
+                        return bad
+
+                    busy = {commit for commit, _ in running.values()}
+                    testable = [
+                        c for c in candidates if c not in skipped and c not in busy
+                    ]
+                    if not testable and not busy & position.keys():
+                        self.logger.error("Only skipped commits left to test")
+                        return None
+
+                    if free_dirs and testable:
+                        pivots = self._pick_pivots(testable, len(free_dirs))
+                        self.logger.info(
+                            "Testing %d of %d remaining commits...",
+                            len(pivots),
+                            len(candidates),
+                        )
+                        for commit in pivots:
+                            work_dir = free_dirs.pop()
+                            future = executor.submit(
+                                self._run_test_script, commit, work_dir
+                            )
+                            running[future] = (commit, work_dir)
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                    new_bad = None
+                    for future in done:
+                        commit, work_dir = running.pop(future)
+                        free_dirs.append(work_dir)
+                        exit_code = future.result()
+                        if commit in self._abandoned:
+                            continue
+
+                        if exit_code == 0:
+                            verdict = "good"
+                            goods.append(commit)
+                        elif exit_code == 125:
+                            verdict = "skip"
+                            skipped.add(commit)
+                        elif 0 < exit_code < 128:
+                            verdict = "bad"
+                            # Candidates are oldest first, so the earliest bad
+                            # commit bounds the range most tightly.
+                            if new_bad is None or position[commit] < position[new_bad]:
+                                new_bad = commit
+                        else:
+                            raise RuntimeError(
+                                f"Test script exited with code {exit_code}"
+                                f" on commit {commit}"
+                            )
+                        self.logger.info("  %s is %s", commit[:12], verdict)
+
+                    if new_bad:
+                        bad = new_bad
+            finally:
+                for commit, _ in running.values():
+                    self._abandon_test(commit)
+
+    @staticmethod
+    def _pick_pivots(commits: list[str], count: int) -> list[str]:
+        """Pick up to count evenly spaced commits, keeping their order."""
+        count = min(count, len(commits))
+        return [commits[(i + 1) * len(commits) // (count + 1)] for i in range(count)]
+
+    def _run_test_script(self, commit: str, work_dir: str) -> Optional[int]:
+        """Check out a commit in a worktree and run the test script on it.
+
+        Args:
+            commit: Commit to test.
+            work_dir: Worktree to test in.
+
+        Returns:
+            The test script's exit code, or None if the test was abandoned
+            before it started.
+        """
+        self.git.checkout(commit, cwd=work_dir)
+        with self._tests_lock:
+            if commit in self._abandoned:
+                return None
+            # Own session, so abandoning the test stops its children too
+            proc = subprocess.Popen(
+                [str(self.test_script), commit, work_dir],
+                cwd=work_dir,
+                start_new_session=True,
+            )
+            self._tests[commit] = proc
+        try:
+            return proc.wait()
+        finally:
+            with self._tests_lock:
+                del self._tests[commit]
+
+    def _abandon_test(self, commit: str):
+        """Stop the test of a commit whose result is no longer needed."""
+        with self._tests_lock:
+            self._abandoned.add(commit)
+            proc = self._tests.get(commit)
+            if proc is not None:
+                kill_process_group(proc)
 
     def print_result(self, bad_commit: str):
         """Print the final result.
@@ -255,27 +570,22 @@ class BisectRunner:
         Args:
             bad_commit: The found bad commit hash.
         """
-        print()
-        print(
-            f"{Colors.BOLD}{Colors.RED}"
-            f"{'=' * 62}\n"
-            f"  BAD COMMIT FOUND\n"
-            f"{'=' * 62}"
-            f"{Colors.RESET}"
-        )
-        print()
-
         commit_info = self.git.get_commit_info(bad_commit)
 
-        print(f"{Colors.BOLD}Commit Details:{Colors.RESET}")
-        print(f"  Hash:    {Colors.RED}{commit_info['hash']}{Colors.RESET}")
-        print(f"  Subject: {commit_info['subject']}")
-        print(
-            f"  Author:  {commit_info['author_name']}"
-            f" <{commit_info['author_email']}>"
+        _write_lines(
+            [
+                "",
+                _banner("BAD COMMIT FOUND", Colors.RED),
+                "",
+                f"{Colors.BOLD}Commit Details:{Colors.RESET}",
+                f"  Hash:    {Colors.RED}{commit_info['hash']}{Colors.RESET}",
+                f"  Subject: {commit_info['subject']}",
+                f"  Author:  {commit_info['author_name']}"
+                f" <{commit_info['author_email']}>",
+                f"  Date:    {commit_info['author_date']}",
+                "",
+            ]
         )
-        print(f"  Date:    {commit_info['author_date']}")
-        print()
 
         # Show ancestry if requested
         if self.show_ancestry:
@@ -287,29 +597,33 @@ class BisectRunner:
         Args:
             commit: The commit to show ancestry for.
         """
-        print(f"{Colors.BOLD}Merge Ancestry:{Colors.RESET}")
+        lines = [f"{Colors.BOLD}Merge Ancestry:{Colors.RESET}"]
 
-        ancestry = self.git.get_merge_ancestry(commit, self.branch)
+        # Show the 5 merges nearest the commit, oldest first
+        ancestry = self.git.get_merge_ancestry(commit, self.branch, limit=5)
 
         if not ancestry:
-            print(f"  {Colors.DIM}(direct commit to {self.branch}){Colors.RESET}")
+            lines.append(
+                f"  {Colors.DIM}(direct commit to {self.branch}){Colors.RESET}"
+            )
         else:
-            print(
+            lines.append(
                 f"  {Colors.DIM}This commit reached {self.branch} through:"
                 f"{Colors.RESET}"
             )
-            items = list(reversed(ancestry[-5:]))  # Show last 5
-            for i, item in enumerate(items):
-                prefix = "  \u2514\u2500" if i == len(items) - 1 else "  \u251c\u2500"
+            last = len(ancestry) - 1
+            for i, item in enumerate(reversed(ancestry)):
+                prefix = "  \u2514\u2500" if i == last else "  \u251c\u2500"
                 branch_info = (
                     f" (from {item['source_branch']})" if item["source_branch"] else ""
                 )
-                print(
+                lines.append(
                     f"  {prefix} {Colors.MAGENTA}{item['merge_commit']}"
                     f"{Colors.RESET}{branch_info}"
                 )
-                print(f"       {Colors.DIM}{item['message'][:60]}{Colors.RESET}")
-        print()
+                lines.append(f"       {Colors.DIM}{item['message'][:60]}{Colors.RESET}")
+        lines.append("")
+        _write_lines(lines)
 
     def run(self) -> int:
         """Main entry point.
@@ -318,26 +632,39 @@ class BisectRunner:
             Exit code: 0 for success, 1 for failure, 2 for invalid args.
         """
         self.print_banner()
-        self.print_config()
-        self.print_estimate()
-
-        if not self.validate():
-            return 2
 
-        if self.dry_run:
-            print(
-                f"{Colors.YELLOW}Dry run mode"
-                f" - not actually running bisect{Colors.RESET}"
-            )
-            return 0
+        # Handlers can only be installed from the main thread
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in _EXIT_SIGNALS:
+                previous_handlers[signum] = signal.signal(signum, _exit_on_signal)
 
         try:
-            # Set up worktree if requested
+            # Create worktrees while the configuration is checked
+            if self.use_worktree and not self.dry_run:
+                self.start_worktree_setup()
+
+            self.print_config()
+            self.print_estimate()
+
+            if not self.validate():
+                return 2
+
+            if self.dry_run:
+                print(
+                    f"{Colors.YELLOW}Dry run mode"
+                    f" - not actually running bisect{Colors.RESET}"
+                )
+                return 0
+
             if self.use_worktree:
-                self.setup_worktree()
+                self.wait_for_worktrees()
 
             # Run bisect
-            bad_commit = self.run_bisect()
+            if self.jobs > 1:
+                bad_commit = self.run_bisect_parallel()
+            else:
+                bad_commit = self.run_bisect()
 
             if bad_commit:
                 self.print_result(bad_commit)
@@ -362,3 +689,6 @@ class BisectRunner:
         finally:
             if self.use_worktree:
                 self.cleanup_worktree()
+            self.git.close()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
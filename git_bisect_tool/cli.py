@@ -28,6 +28,9 @@ Examples:
   # With worktree isolation
   git-bisect-tool --good v1.0.0 --bad HEAD --test ./test.sh --worktree
 
+  # Test up to 4 commits at a time, each in its own worktree
+  git-bisect-tool --good v1.0.0 --test ./test.sh --jobs 4
+
   # Show what would happen without running
   git-bisect-tool --good abc123 --test ./test.sh --dry-run
 
@@ -84,6 +87,15 @@ Exit Codes:
         action="store_true",
         help="Use a temporary worktree for isolation",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Test up to N commits in parallel, each in its own worktree"
+        " (implies --worktree, default: 1)",
+    )
     parser.add_argument(
         "--show-ancestry",
         "-a",
@@ -119,6 +131,8 @@ def main(argv=None) -> int:
 
     parser = create_parser()
     args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     runner = BisectRunner(
         repo_path=args.repo,
@@ -130,6 +144,7 @@ def main(argv=None) -> int:
         show_ancestry=args.show_ancestry,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        jobs=args.jobs,
     )
 
     return runner.run()
@@ -1,9 +1,23 @@
 """Git command wrapper with logging."""
 
 import logging
+import os
 import re
+import shutil
+import signal
 import subprocess
-from typing import Optional, TypedDict
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, TypedDict
+
+# Length of the abbreviated hashes in CommitInfo.short_hash
+SHORT_HASH_LENGTH = 12
+
+# Source branch named in a merge commit subject; used with match(), so it is
+# anchored at the start of the subject
+_MERGE_BRANCH_RE = re.compile(
+    r"Merge (?:branch |pull request \S+ from )['\"]?([^'\"\s]+)"
+)
 
 
 class GitError(Exception):
@@ -34,15 +48,62 @@ class MergeAncestryEntry(TypedDict):
 class Git:
     """Git command wrapper with logging."""
 
-    def __init__(self, repo_path: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        repo_path: str,
+        logger: Optional[logging.Logger] = None,
+        runner: Optional[Callable[..., subprocess.CompletedProcess]] = None,
+    ):
         """Initialize Git wrapper.
 
         Args:
             repo_path: Path to the git repository.
             logger: Optional logger instance. If not provided, uses module logger.
+            runner: Optional stand-in for subprocess.run, used to run one-shot
+                git commands. Defaults to subprocess.run.
         """
         self.repo_path = repo_path
         self.logger = logger or logging.getLogger("git-bisect-tool")
+        self._runner = runner if runner is not None else subprocess.run
+
+        # An absolute executable path plus close_fds=False lets subprocess
+        # launch git via posix_spawn (vfork) instead of fork + exec.
+        self._git_executable = shutil.which("git")
+
+        # Command prefix for the common case of running in repo_path
+        self._base_cmd = ["git", "-C", repo_path]
+
+        # Long-lived `git cat-file --batch`, started on first commit lookup
+        self._cat_file: Optional[subprocess.Popen] = None
+
+        # Commit details by full hash; commits are immutable, so never stale
+        self._commit_info_cache: dict[str, CommitInfo] = {}
+
+        # Full hashes already seen to name commits; symbolic refs are never
+        # recorded, so nothing here can go stale
+        self._known_commits: set[str] = set()
+
+    def __enter__(self) -> "Git":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the background cat-file process, if one was started.
+
+        Safe to call more than once; a later lookup starts a new process.
+        """
+        proc, self._cat_file = self._cat_file, None
+        if proc is None:
+            return
+        # Popen's own exit closes the pipes and waits for cat-file; closing
+        # the pipe to one that died fails if input is still buffered
+        try:
+            with proc:
+                pass
+        except OSError:
+            pass
 
     def run(
         self,
@@ -65,19 +126,106 @@ class Git:
         Raises:
             GitError: If command fails and check=True.
         """
-        cmd = ["git", "-C", cwd or self.repo_path, *args]
-        self.logger.debug("Running: %s", " ".join(cmd))
+        return self._run(args, cwd, check, capture_output=capture_output)
+
+    def run_silent(self, *args: str, check: bool = True, cwd: Optional[str] = None):
+        """Run a git command whose output is not needed.
+
+        stdout is discarded rather than read through a pipe; stderr is still
+        captured so failures can be reported.
+
+        Args:
+            *args: Git command arguments.
+            check: Whether to raise exception on non-zero exit.
+            cwd: Working directory (defaults to repo_path).
+
+        Raises:
+            GitError: If command fails and check=True.
+        """
+        self._run(args, cwd, check, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    def _run(
+        self, args: tuple[str, ...], cwd: Optional[str], check: bool, **kwargs
+    ) -> subprocess.CompletedProcess:
+        """Run a git command with the given stream settings for the runner."""
+        cmd = self._command(args, cwd)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running: %s", " ".join(cmd))
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=capture_output, text=True, check=check
+            result = self._runner(
+                cmd,
+                executable=self._git_executable,
+                # Commit messages need not be valid UTF-8, nor match the locale
+                encoding="utf-8",
+                errors="replace",
+                check=check,
+                close_fds=False,
+                **kwargs,
             )
-            if result.stdout:
+            if result.stdout and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug("stdout: %s", result.stdout.strip())
             return result
         except subprocess.CalledProcessError as e:
-            self.logger.error("Git command failed: %s", e.stderr)
-            raise GitError(f"Git command failed: {' '.join(cmd)}\n{e.stderr}") from e
+            # Uncaptured stderr has already gone to the terminal
+            stderr = e.stderr or ""
+            self.logger.error("Git command failed: %s", stderr)
+            raise GitError(f"Git command failed: {' '.join(cmd)}\n{stderr}") from e
+
+    def _command(self, args: tuple[str, ...], cwd: Optional[str]) -> list[str]:
+        """Build the argv for a git command run in cwd (default: repo_path)."""
+        if not cwd:
+            return [*self._base_cmd, *args]
+        return ["git", "-C", cwd, *args]
+
+    def run_streaming(
+        self,
+        *args: str,
+        on_line: Callable[[str], None],
+        cwd: Optional[str] = None,
+    ) -> int:
+        """Run a git command, echoing its output to stdout as it arrives.
+
+        stderr is merged into stdout so the caller sees one ordered stream.
+
+        Args:
+            *args: Git command arguments.
+            on_line: Called with each line of output.
+            cwd: Working directory (defaults to repo_path).
+
+        Returns:
+            The command's exit code.
+        """
+        cmd = self._command(args, cwd)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running: %s", " ".join(cmd))
+
+        # Run in a new session so an interrupt can stop git together with
+        # whatever it started, e.g. the test script. That rules out
+        # posix_spawn anyway, so keep the default close_fds=True and do not
+        # pass our descriptors on to the test script.
+        with subprocess.Popen(
+            cmd,
+            executable=self._git_executable,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            # Decode like _run, whatever the locale
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            start_new_session=True,
+        ) as proc:
+            try:
+                for line in proc.stdout:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                    on_line(line)
+            except BaseException:
+                # The new session does not receive the terminal's Ctrl-C
+                kill_process_group(proc)
+                raise
+
+        return proc.returncode
 
     def get_current_branch(self) -> str:
         """Get the current branch name."""
@@ -85,9 +233,29 @@ class Git:
         return result.stdout.strip()
 
     def get_commit_hash(self, ref: str) -> str:
-        """Get the full commit hash for a ref."""
-        result = self.run("rev-parse", ref)
-        return result.stdout.strip()
+        """Get the full commit hash for a ref.
+
+        Raises:
+            GitError: If ref does not name a commit, or cat-file died.
+        """
+        return self.resolve_refs(ref)[0]
+
+    def resolve_refs(self, *refs: str) -> list[str]:
+        """Get the full commit hashes for several refs.
+
+        All lookups go through the same background cat-file process. Full
+        hashes of commits already read are returned without asking git.
+
+        Returns:
+            Full commit hashes, in the order of refs.
+
+        Raises:
+            GitError: If any ref does not name a commit.
+        """
+        return [
+            ref if ref in self._known_commits else self._read_commit(ref)[0]
+            for ref in refs
+        ]
 
     def get_commit_info(self, ref: str) -> CommitInfo:
         """Get detailed commit information.
@@ -95,23 +263,95 @@ class Git:
         Returns:
             CommitInfo with hash, short_hash, subject, author_name,
             author_email, author_date.
+
+        Lookups by full hash are cached for the life of this instance.
+
+        Raises:
+            GitError: If ref does not name a commit, or cat-file died.
         """
-        result = self.run("log", "-1", "--format=%H%n%h%n%s%n%an%n%ae%n%ai", ref)
-        lines = result.stdout.strip().split("\n")
-        return CommitInfo(
-            hash=lines[0],
-            short_hash=lines[1],
-            subject=lines[2],
-            author_name=lines[3],
-            author_email=lines[4],
-            author_date=lines[5],
-        )
+        info = self._commit_info_cache.get(ref)
+        if info is None:
+            info = _parse_commit(*self._read_commit(ref))
+            self._commit_info_cache[info["hash"]] = info
+        return info
+
+    def _read_commit(self, ref: str) -> tuple[str, bytes]:
+        """Read a commit object through the background cat-file process.
+
+        Returns:
+            The commit's full hash and its raw object contents.
+
+        Raises:
+            GitError: If ref does not name a commit, or cat-file died.
+        """
+        if self._cat_file is None:
+            cmd = [*self._base_cmd, "cat-file", "--batch"]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Starting: %s", " ".join(cmd))
+            self._cat_file = subprocess.Popen(
+                cmd,
+                executable=self._git_executable,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                close_fds=False,
+            )
+
+        proc = self._cat_file
+        try:
+            proc.stdin.write(f"{ref}^{{commit}}\n".encode())
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+        except OSError as e:
+            self.close()
+            raise GitError(f"git cat-file failed: {e}") from e
+        if not header:
+            # EOF: the process exited; the next lookup starts a new one
+            self.close()
+            raise GitError(f"git cat-file exited while reading {ref}")
+
+        # Header is "<sha> commit <size>", or "<ref> missing" on failure;
+        # a ref with spaces in it also splits into three fields when missing
+        header = header.split()
+        if len(header) != 3 or header[1] != b"commit":
+            raise GitError(f"Not a valid commit: {ref}")
+        size = int(header[2])
+        body = proc.stdout.read(size + 1)
+        if len(body) != size + 1:
+            self.close()
+            raise GitError(f"git cat-file exited while reading {ref}")
+        body = body[:-1]
+        sha = header[0].decode()
+        self._known_commits.add(sha)
+        return sha, body
 
     def count_commits_between(self, good: str, bad: str) -> int:
         """Count the number of commits between good and bad."""
         result = self.run("rev-list", "--count", f"{good}..{bad}")
         return int(result.stdout.strip())
 
+    def count_left_right(self, good: str, bad: str) -> tuple[int, int]:
+        """Count commits on each side of the symmetric difference good...bad.
+
+        Returns:
+            A (left, right) tuple: commits reachable only from good, and
+            commits reachable only from bad. A left count of 0 means good is
+            an ancestor of bad.
+        """
+        result = self.run("rev-list", "--left-right", "--count", f"{good}...{bad}")
+        left, right = result.stdout.split()
+        return int(left), int(right)
+
+    def list_commits(self, tip: str, exclude: list[str]) -> list[str]:
+        """List commits reachable from tip but not from any excluded commit.
+
+        Returns:
+            Full commit hashes in topological order, oldest first.
+        """
+        result = self.run(
+            "rev-list", "--topo-order", "--reverse", tip, "--not", *exclude
+        )
+        return result.stdout.split()
+
     def is_ancestor(self, ancestor: str, descendant: str) -> bool:
         """Check if one commit is an ancestor of another."""
         result = self.run(
@@ -120,11 +360,17 @@ class Git:
         return result.returncode == 0
 
     def get_merge_ancestry(
-        self, commit: str, target_branch: str
+        self, commit: str, target_branch: str, limit: Optional[int] = None
     ) -> list[MergeAncestryEntry]:
         """Get the merge ancestry path of a commit.
 
-        Returns a list showing how the commit was merged into the target branch.
+        Returns a list showing how the commit was merged into the target branch,
+        newest merge first.
+
+        Args:
+            commit: Commit to trace.
+            target_branch: Branch the commit was merged into.
+            limit: If given, only return the merges closest to the commit.
         """
         ancestry: list[MergeAncestryEntry] = []
 
@@ -132,66 +378,152 @@ class Git:
             "log",
             "--ancestry-path",
             "--merges",
+            "-z",
             "--format=%H %s",
             f"{commit}..{target_branch}",
         )
 
-        if result.stdout.strip():
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                parts = line.split(" ", 1)
-                merge_hash = parts[0]
-                merge_subject = parts[1] if len(parts) > 1 else ""
-
-                # Try to extract branch name from merge commit message
-                branch_match = re.search(
-                    r"Merge (?:branch |pull request .* from )['\"]?([^'\"\s]+)",
-                    merge_subject,
-                )
-                branch_name = branch_match.group(1) if branch_match else None
-
-                ancestry.append(
-                    MergeAncestryEntry(
-                        merge_commit=merge_hash[:12],
-                        message=merge_subject,
-                        source_branch=branch_name,
-                    )
+        # -z ends every record with NUL, which no subject can contain
+        records = result.stdout.split("\0")[:-1]
+        # git lists newest first; the merges nearest the commit are last
+        if limit is not None:
+            records = records[-limit:]
+        for record in records:
+            merge_hash, _, merge_subject = record.partition(" ")
+
+            # Try to extract branch name from merge commit message
+            branch_match = _MERGE_BRANCH_RE.match(merge_subject)
+            branch_name = branch_match.group(1) if branch_match else None
+
+            ancestry.append(
+                MergeAncestryEntry(
+                    merge_commit=merge_hash[:12],
+                    message=merge_subject,
+                    source_branch=branch_name,
                 )
+            )
 
         return ancestry
 
     def create_worktree(self, path: str, ref: str) -> str:
         """Create a git worktree at the specified path."""
-        self.run("worktree", "add", "--detach", path, ref)
+        self.run_silent("worktree", "add", "--detach", path, ref)
         return path
 
+    def get_submodule_paths(self, cwd: Optional[str] = None) -> list[str]:
+        """Get the paths of the submodules listed in .gitmodules."""
+        result = self.run(
+            "config",
+            "--file",
+            ".gitmodules",
+            "--get-regexp",
+            r"^submodule\..*\.path$",
+            cwd=cwd,
+            check=False,
+        )
+        return [
+            line.partition(" ")[2] for line in result.stdout.split("\n") if " " in line
+        ]
+
+    def init_submodule(
+        self, path: str, reference: Optional[str] = None, cwd: Optional[str] = None
+    ):
+        """Initialize and check out a submodule.
+
+        Args:
+            path: Submodule path relative to the working tree.
+            reference: Optional repository to borrow objects from instead of
+                fetching them again.
+            cwd: Working tree to initialize the submodule in.
+        """
+        args = ["submodule", "update", "--init"]
+        if reference:
+            args += ["--reference", reference]
+        self.run(*args, "--", path, cwd=cwd)
+
+    def checkout(self, ref: str, cwd: Optional[str] = None):
+        """Check out a commit as a detached HEAD."""
+        self.run_silent("checkout", "--quiet", "--detach", ref, cwd=cwd)
+
     def remove_worktree(self, path: str):
         """Remove a git worktree."""
-        self.run("worktree", "remove", "--force", path, check=False)
+        self.run_silent("worktree", "remove", "--force", path, check=False)
 
     def bisect_start(self, bad: str, good: str, cwd: Optional[str] = None):
         """Start a git bisect session."""
-        self.run("bisect", "start", bad, good, cwd=cwd)
+        self.run_silent("bisect", "start", bad, good, cwd=cwd)
 
     def bisect_reset(self, cwd: Optional[str] = None):
         """Reset a git bisect session."""
-        self.run("bisect", "reset", cwd=cwd, check=False)
-
-    def bisect_estimate(self, bad: str, good: str) -> Optional[int]:
-        """Return git bisect's step estimate without moving HEAD."""
-        start = self.run(
-            "bisect",
-            "start",
-            "--no-checkout",
-            bad,
-            good,
-            capture_output=True,
-            check=False,
+        self.run_silent("bisect", "reset", cwd=cwd, check=False)
+
+    def get_bisect_bad(self, cwd: Optional[str] = None) -> Optional[str]:
+        """Get the commit currently marked bad in a bisect session.
+
+        Once ``git bisect run`` succeeds this is the first bad commit.
+
+        Returns:
+            Full commit hash, or None if no bisect session is active.
+        """
+        result = self.run(
+            "rev-parse", "--verify", "--quiet", "refs/bisect/bad", cwd=cwd, check=False
         )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+
+def kill_process_group(proc: subprocess.Popen):
+    """Terminate a process started with start_new_session and its children."""
+    if proc.returncode is None:
         try:
-            output = (start.stdout or "") + (start.stderr or "")
-            match = re.search(r"roughly (\d+) steps?", output)
-            return int(match.group(1)) if match else None
-        finally:
-            self.run("bisect", "reset", check=False)
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _parse_commit(sha: str, raw: bytes) -> CommitInfo:
+    """Build CommitInfo from a raw commit object as printed by cat-file."""
+    headers, _, body = raw.partition(b"\n\n")
+
+    author = b""
+    encoding = "utf-8"
+    for line in headers.split(b"\n"):
+        if line.startswith(b"author ") and not author:
+            author = line[len(b"author ") :]
+        elif line.startswith(b"encoding "):
+            encoding = line[len(b"encoding ") :].decode("ascii", errors="replace")
+
+    # Like git log, decode with the encoding the commit was recorded in
+    try:
+        message = body.decode(encoding, errors="replace")
+    except LookupError:
+        encoding = "utf-8"
+        message = body.decode(encoding, errors="replace")
+
+    # "Name <email> <epoch> <+hhmm>"; fields are left empty if it is missing
+    name, _, rest = author.decode(encoding, errors="replace").partition(" <")
+    email, _, stamp = rest.partition("> ")
+    epoch, _, offset = stamp.partition(" ")
+    try:
+        sign = -1 if offset.startswith("-") else 1
+        tz = timezone(
+            sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        )
+        date = datetime.fromtimestamp(int(epoch), tz).strftime("%Y-%m-%d %H:%M:%S %z")
+    except (ValueError, OverflowError, OSError):
+        date = stamp
+
+    # Like %s: the first paragraph of the message, folded onto one line
+    subject = " ".join(
+        line.strip() for line in message.strip().split("\n\n")[0].split("\n")
+    )
+
+    return CommitInfo(
+        hash=sha,
+        short_hash=sha[:SHORT_HASH_LENGTH],
+        subject=subject,
+        author_name=name,
+        author_email=email,
+        author_date=date,
+    )
@@ -1,17 +1,23 @@
 """Logging configuration for the git bisect tool."""
 
-import copy
 import logging
 import sys
 
 from .colors import Colors
 
 
+class _RecordFields:
+    """Stand-in record for a formatter style, which only reads ``__dict__``."""
+
+    def __init__(self, fields: dict):
+        self.__dict__ = fields
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors based on log level.
 
-    Creates a shallow copy of each log record before modifying it so
-    that other handlers attached to the same logger are not affected.
+    Colors are applied to the formatted string rather than to the log
+    record, so other handlers attached to the same logger are not affected.
     """
 
     LEVEL_COLORS = {
@@ -22,13 +28,30 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: Colors.BG_RED + Colors.WHITE,
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        record = copy.copy(record)
-        color = self.LEVEL_COLORS.get(record.levelno, Colors.RESET)
-        record.levelname = f"{color}{record.levelname}{Colors.RESET}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # LEVEL_COLORS is filled in at import time; Colors.init() may have
+        # disabled colors since, which leaves Colors.RESET empty
+        self._reset = Colors.RESET
+        self._level_colors = {
+            level: color if self._reset else ""
+            for level, color in self.LEVEL_COLORS.items()
+        }
+        self._level_prefixes = {
+            level: f"{color}{logging.getLevelName(level)}{self._reset}"
+            for level, color in self._level_colors.items()
+        }
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        color = self._level_colors.get(record.levelno, self._reset)
+        fields = {
+            "levelname": self._level_prefixes.get(
+                record.levelno, f"{color}{record.levelname}{self._reset}"
+            )
+        }
         if record.levelno >= logging.WARNING:
-            record.msg = f"{color}{record.msg}{Colors.RESET}"
-        return super().format(record)
+            fields["message"] = f"{color}{record.message}{self._reset}"
+        return self._style.format(_RecordFields(record.__dict__ | fields))
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -1,99 +1,201 @@
 """Tests for BisectRunner."""
 
 import os
+import signal
+import stat
 import tempfile
+import time
 import unittest
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import call, patch, Mock
 
-from git_bisect_tool.bisect import BisectRunner
+from git_bisect_tool.bisect import BisectRunner, _estimate_steps
+from git_bisect_tool.git import CommitInfo, Git, GitError
 
+REPO = "/fake/repo"
+TEST_SCRIPT = "/fake/test.sh"
 
-class TestBisectRunnerInit(unittest.TestCase):
+# Paths validate() stats for a repository with an executable test script
+REPO_FILES = {
+    f"{REPO}/.git": stat.S_IFDIR | 0o755,
+    TEST_SCRIPT: stat.S_IFREG | 0o755,
+}
+
+
+def _fake_stat(modes: dict[str, int]):
+    """Build an os.stat stand-in that only knows the given paths."""
+
+    def fake(path, *args, **kwargs):
+        try:
+            mode = modes[str(path)]
+        except KeyError:
+            raise FileNotFoundError(2, "No such file or directory", str(path)) from None
+        return os.stat_result((mode, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+
+    return fake
+
+
+def _fake_access(modes: dict[str, int]):
+    """Build an os.access stand-in that checks execute bits in modes."""
+
+    def fake(path, mode, *args, **kwargs):
+        return bool(modes.get(str(path), 0) & 0o111)
+
+    return fake
+
+
+COMMIT_INFO = CommitInfo(
+    hash="abc123",
+    short_hash="abc123",
+    subject="Change something",
+    author_name="A U Thor",
+    author_email="author@example.com",
+    author_date="2024-01-01 12:00:00 +0000",
+)
+
+
+def _make_mock_git(**return_values) -> Mock:
+    """Build a mock Git for a valid ten-commit range.
+
+    Args:
+        **return_values: Return values to override, by Git method name.
+    """
+    mock_git = Mock(spec=Git)
+    mock_git.get_current_branch.return_value = "main"
+    mock_git.resolve_refs.return_value = ["abc123", "abc123"]
+    mock_git.count_left_right.return_value = (0, 10)
+    mock_git.get_commit_info.return_value = COMMIT_INFO
+    for name, value in return_values.items():
+        getattr(mock_git, name).return_value = value
+    return mock_git
+
+
+class _RunnerTestCase(unittest.TestCase):
+    """Base for BisectRunner tests, with Git and setup_logging patched.
+
+    self.mock_git is the Git instance BisectRunner will use, built by
+    _make_mock_git() with the class's GIT_RETURN_VALUES; tests override
+    what else they need.
+    """
+
+    GIT_RETURN_VALUES: dict = {}
+
+    def setUp(self):
+        self.mock_git = _make_mock_git(**self.GIT_RETURN_VALUES)
+        git_patcher = patch("git_bisect_tool.bisect.Git", return_value=self.mock_git)
+        git_patcher.start()
+        self.addCleanup(git_patcher.stop)
+        logging_patcher = patch("git_bisect_tool.bisect.setup_logging")
+        logging_patcher.start()
+        self.addCleanup(logging_patcher.stop)
+
+
+class TestBisectRunnerInit(_RunnerTestCase):
     """Tests for BisectRunner initialization."""
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_init_resolves_commits(self, mock_logging, mock_git_class):
+    def test_init_resolves_commits(self):
         """BisectRunner resolves commit refs to full hashes."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.side_effect = ["abc123full", "def456full"]
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
+        self.mock_git.resolve_refs.return_value = ["abc123full", "def456full"]
 
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="abc",
-                bad_commit="def",
-                test_script=test_script,
-            )
+        runner = BisectRunner(
+            repo_path=REPO,
+            good_commit="abc",
+            bad_commit="def",
+            test_script=TEST_SCRIPT,
+        )
 
         self.assertEqual(runner.good_commit, "abc123full")
         self.assertEqual(runner.bad_commit, "def456full")
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_init_uses_provided_branch(self, mock_logging, mock_git_class):
+    def test_init_uses_provided_branch(self):
         """BisectRunner uses explicit branch when provided."""
-        mock_git = MagicMock()
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
-
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="good",
-                bad_commit="bad",
-                test_script=test_script,
-                branch="develop",
-            )
+        runner = BisectRunner(
+            repo_path=REPO,
+            good_commit="good",
+            bad_commit="bad",
+            test_script=TEST_SCRIPT,
+            branch="develop",
+        )
 
         self.assertEqual(runner.branch, "develop")
-        mock_git.get_current_branch.assert_not_called()
+        self.mock_git.get_current_branch.assert_not_called()
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_init_detects_branch(self, mock_logging, mock_git_class):
+    def test_init_detects_branch(self):
         """BisectRunner detects current branch when none provided."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
-
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="good",
-                bad_commit="bad",
-                test_script=test_script,
-            )
+        runner = BisectRunner(
+            repo_path=REPO,
+            good_commit="good",
+            bad_commit="bad",
+            test_script=TEST_SCRIPT,
+        )
 
         self.assertEqual(runner.branch, "main")
 
 
-class TestBisectRunnerValidate(unittest.TestCase):
+class TestBisectRunnerValidate(_RunnerTestCase):
     """Tests for validation logic."""
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_validate_missing_repo(self, mock_logging, mock_git_class):
+    def _validate(self, modes=REPO_FILES, counts=(0, 10)) -> bool:
+        """Run validate() against a fake filesystem holding only modes."""
+        self.mock_git.count_left_right.return_value = counts
+
+        runner = BisectRunner(
+            repo_path=REPO,
+            good_commit="good",
+            bad_commit="bad",
+            test_script=TEST_SCRIPT,
+        )
+
+        with (
+            patch("git_bisect_tool.bisect.os.stat", side_effect=_fake_stat(modes)),
+            patch("git_bisect_tool.bisect.os.access", side_effect=_fake_access(modes)),
+        ):
+            return runner.validate()
+
+    def test_validate_missing_repo(self):
         """Validation fails if repo doesn't exist."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git_class.return_value = mock_git
+        self.assertFalse(self._validate(modes={}))
+
+    def test_validate_missing_test_script(self):
+        """Validation fails if test script doesn't exist."""
+        modes = {f"{REPO}/.git": stat.S_IFDIR | 0o755}
+
+        self.assertFalse(self._validate(modes=modes))
+
+    def test_validate_good_not_ancestor(self):
+        """Validation fails if good is not ancestor of bad."""
+        self.assertFalse(self._validate(counts=(2, 10)))
+
+    def test_validate_no_commits_between(self):
+        """Validation fails if no commits between good and bad."""
+        self.assertFalse(self._validate(counts=(0, 0)))
+
+    def test_validate_success(self):
+        """Validation passes with valid config."""
+        self.assertTrue(self._validate())
+
+    @patch("git_bisect_tool.bisect.Path.chmod")
+    def test_validate_makes_script_executable(self, mock_chmod):
+        """Validation marks a non-executable test script executable."""
+        modes = {**REPO_FILES, TEST_SCRIPT: stat.S_IFREG | 0o644}
+
+        self.assertTrue(self._validate(modes=modes))
+        mock_chmod.assert_called_once_with(0o755)
+
+    def test_validate_linked_worktree(self):
+        """Validation accepts a linked worktree, whose .git is a file."""
+        modes = {**REPO_FILES, f"{REPO}/.git": stat.S_IFREG | 0o644}
+
+        self.assertTrue(self._validate(modes=modes))
+
+
+class TestBisectRunnerEstimate(_RunnerTestCase):
+    """Tests for the step estimate."""
+
+    def test_estimate_shares_counts_with_validate(self):
+        """print_estimate computes git's estimate from the cached range count."""
+        self.mock_git.count_left_right.return_value = (0, 39)
 
         runner = BisectRunner(
             repo_path="/nonexistent/repo",
@@ -102,109 +204,332 @@ class TestBisectRunnerValidate(unittest.TestCase):
             test_script="./test.sh",
         )
 
-        self.assertFalse(runner.validate())
+        with patch("sys.stdout") as mock_stdout:
+            runner.print_estimate()
+            runner.print_estimate()
+
+        self.assertIn("~4", mock_stdout.write.call_args[0][0])
+        self.mock_git.count_left_right.assert_called_once()
+
+    def test_estimate_matches_git(self):
+        """_estimate_steps matches the "roughly N steps" git bisect prints."""
+        # Range size -> estimate, as printed by git bisect start
+        expected = {
+            0: 0,
+            1: 0,
+            2: 0,
+            3: 1,
+            4: 1,
+            5: 1,
+            6: 2,
+            7: 2,
+            8: 2,
+            12: 3,
+            16: 3,
+            24: 4,
+            39: 4,
+        }
+        for count, steps in expected.items():
+            with self.subTest(count=count):
+                self.assertEqual(_estimate_steps(count), steps)
+
+
+class TestBisectRunnerRun(_RunnerTestCase):
+    """Tests for the run() entry point."""
+
+    def test_worktree_created_before_validation(self):
+        """Worktrees are created up front and cleaned up if validation fails."""
+        runner = BisectRunner(
+            repo_path="/nonexistent/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+            use_worktree=True,
+        )
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_validate_missing_test_script(self, mock_logging, mock_git_class):
-        """Validation fails if test script doesn't exist."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git_class.return_value = mock_git
+        with patch("sys.stdout"):
+            self.assertEqual(runner.run(), 2)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create .git directory to make it look like a repo
-            os.makedirs(os.path.join(tmpdir, ".git"))
+        self.mock_git.create_worktree.assert_called_once_with(
+            str(runner.worktree_path), "abc123"
+        )
+        self.assertFalse(runner.temp_dir.exists())
 
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="good",
-                bad_commit="bad",
-                test_script="/nonexistent/test.sh",
-            )
+    def test_failed_worktree_setup_cleans_up(self):
+        """A failure starting worktree setup still cleans up and closes git."""
+        runner = BisectRunner(
+            repo_path="/nonexistent/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+            use_worktree=True,
+        )
 
-            self.assertFalse(runner.validate())
+        with (
+            patch("sys.stdout"),
+            patch.object(
+                runner, "start_worktree_setup", side_effect=OSError("no space")
+            ),
+            patch.object(runner, "cleanup_worktree") as mock_cleanup,
+        ):
+            self.assertEqual(runner.run(), 1)
+
+        mock_cleanup.assert_called_once_with()
+        self.mock_git.close.assert_called_once_with()
+
+    def test_sigterm_stops_bisect(self):
+        """SIGTERM during the bisect run still resets bisect and cleans up."""
+        self.mock_git.run_streaming.side_effect = lambda *args, **kwargs: os.kill(
+            os.getpid(), signal.SIGTERM
+        )
+        runner = BisectRunner(
+            repo_path="/nonexistent/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+        )
+        handler = signal.getsignal(signal.SIGTERM)
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_validate_good_not_ancestor(self, mock_logging, mock_git_class):
-        """Validation fails if good is not ancestor of bad."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git.is_ancestor.return_value = False
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            os.makedirs(os.path.join(tmpdir, ".git"))
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
-            os.chmod(test_script, 0o755)
+        with patch("sys.stdout"), patch.object(runner, "validate", return_value=True):
+            with self.assertRaises(SystemExit) as cm:
+                runner.run()
 
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="good",
-                bad_commit="bad",
-                test_script=test_script,
-            )
+        self.assertEqual(cm.exception.code, 128 + signal.SIGTERM)
+        self.mock_git.bisect_reset.assert_called_once()
+        self.mock_git.close.assert_called_once_with()
+        self.assertIs(signal.getsignal(signal.SIGTERM), handler)
 
-            self.assertFalse(runner.validate())
+    def test_cleanup_removes_leftover_files(self):
+        """Cleanup still removes the temp dir if worktree removal left files."""
+        runner = BisectRunner(
+            repo_path="/nonexistent/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+            use_worktree=True,
+        )
+        runner.setup_worktree()
+        (runner.temp_dir / "leftover").write_text("x")
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_validate_no_commits_between(self, mock_logging, mock_git_class):
-        """Validation fails if no commits between good and bad."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git.is_ancestor.return_value = True
-        mock_git.count_commits_between.return_value = 0
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            os.makedirs(os.path.join(tmpdir, ".git"))
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
-            os.chmod(test_script, 0o755)
+        runner.cleanup_worktree()
 
-            runner = BisectRunner(
-                repo_path=tmpdir,
-                good_commit="good",
-                bad_commit="bad",
-                test_script=test_script,
-            )
+        self.assertFalse(runner.temp_dir.exists())
 
-            self.assertFalse(runner.validate())
+    def test_cleanup_removes_every_worktree(self):
+        """Cleanup removes the worktree of every parallel job."""
+        self.mock_git.create_worktree.side_effect = lambda path, ref: os.mkdir(path)
+        self.mock_git.remove_worktree.side_effect = os.rmdir
 
-    @patch("git_bisect_tool.bisect.Git")
-    @patch("git_bisect_tool.bisect.setup_logging")
-    def test_validate_success(self, mock_logging, mock_git_class):
-        """Validation passes with valid config."""
-        mock_git = MagicMock()
-        mock_git.get_current_branch.return_value = "main"
-        mock_git.get_commit_hash.return_value = "abc123"
-        mock_git.is_ancestor.return_value = True
-        mock_git.count_commits_between.return_value = 10
-        mock_git_class.return_value = mock_git
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            os.makedirs(os.path.join(tmpdir, ".git"))
-            test_script = os.path.join(tmpdir, "test.sh")
-            with open(test_script, "w") as f:
-                f.write("#!/bin/bash\nexit 0")
-            os.chmod(test_script, 0o755)
+        runner = BisectRunner(
+            repo_path="/nonexistent/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+            use_worktree=True,
+            jobs=3,
+        )
+        runner.setup_worktree()
 
+        runner.cleanup_worktree()
+
+        removed = sorted(
+            c.args[0] for c in self.mock_git.remove_worktree.call_args_list
+        )
+        expected = [runner.worktree_path, *runner.extra_worktree_paths]
+        self.assertEqual(removed, sorted(str(path) for path in expected))
+        self.assertFalse(runner.temp_dir.exists())
+
+    def test_worktree_submodules(self):
+        """Only submodules checked out in the repository are initialized."""
+        with tempfile.TemporaryDirectory() as repo:
+            os.makedirs(f"{repo}/lib/.git")
+            self.mock_git.get_submodule_paths.return_value = ["lib", "other"]
+            self.mock_git.init_submodule.side_effect = [GitError("bad ref"), None]
             runner = BisectRunner(
-                repo_path=tmpdir,
+                repo_path=repo,
                 good_commit="good",
                 bad_commit="bad",
-                test_script=test_script,
+                test_script="./test.sh",
             )
+            worktree = Path(repo) / "wt"
+            worktree.mkdir()
+            (worktree / ".gitmodules").touch()
+
+            runner._create_worktree(worktree)
+
+        self.assertEqual(
+            self.mock_git.init_submodule.call_args_list,
+            [
+                call("lib", reference=str(runner.repo_path / "lib"), cwd=str(worktree)),
+                call("lib", cwd=str(worktree)),
+            ],
+        )
+
+
+class TestBisectRunnerRunBisect(_RunnerTestCase):
+    """Tests for run_bisect result detection."""
+
+    FIRST_BAD = "f" * 40
+
+    def _make_runner(self, run_returncode):
+        self.mock_git.run_streaming.return_value = run_returncode
+        self.mock_git.run.return_value = SimpleNamespace(
+            returncode=0,
+            stdout=(
+                "git bisect start 'bad' 'good'\n"
+                f"# bad: [{'b' * 40}] Later change\n"
+                f"git bisect bad {'b' * 40}\n"
+                f"# first bad commit: [{self.FIRST_BAD}] Break it\n"
+            ),
+        )
+        self.mock_git.get_bisect_bad.return_value = self.FIRST_BAD
+
+        runner = BisectRunner(
+            repo_path="/repo",
+            good_commit="good",
+            bad_commit="bad",
+            test_script="./test.sh",
+        )
+        return runner
+
+    def test_detects_result_from_output(self):
+        """run_bisect picks up the result from git bisect run's output."""
+        runner = self._make_runner(run_returncode=0)
+
+        def fake_streaming(*args, on_line, cwd=None):
+            on_line("running  './test.sh'\n")
+            on_line(f"{self.FIRST_BAD} is the first bad commit\n")
+            return 0
+
+        self.mock_git.run_streaming.side_effect = fake_streaming
+
+        with patch("sys.stdout"):
+            result = runner.run_bisect()
+
+        self.assertEqual(result, self.FIRST_BAD)
+        self.mock_git.get_bisect_bad.assert_not_called()
+        self.mock_git.run.assert_not_called()
+
+    def test_reads_bisect_bad_ref(self):
+        """run_bisect takes the result from refs/bisect/bad."""
+        runner = self._make_runner(run_returncode=0)
+
+        with patch("sys.stdout"):
+            result = runner.run_bisect()
+
+        self.assertEqual(result, self.FIRST_BAD)
+        self.assertNotIn("log", [c[0][1] for c in self.mock_git.run.call_args_list])
+        self.mock_git.bisect_reset.assert_called_once()
+        args = self.mock_git.run_streaming.call_args[0]
+        self.assertEqual(args[:4], ("bisect", "run", "sh", "-c"))
+        self.assertEqual(args[-1], str(runner.test_script))
+
+    def test_falls_back_to_bisect_log(self):
+        """run_bisect parses the bisect log when the ref is unavailable."""
+        runner = self._make_runner(run_returncode=0)
+        self.mock_git.get_bisect_bad.return_value = None
+
+        with patch("sys.stdout"):
+            result = runner.run_bisect()
+
+        self.assertEqual(result, self.FIRST_BAD)
+
+    def test_failed_run_skips_lookup(self):
+        """run_bisect returns None without further git calls on failure."""
+        runner = self._make_runner(run_returncode=2)
+
+        with patch("sys.stdout"):
+            result = runner.run_bisect()
+
+        self.assertIsNone(result)
+        self.mock_git.get_bisect_bad.assert_not_called()
+        self.assertNotIn("log", [c[0][1] for c in self.mock_git.run.call_args_list])
+        self.mock_git.bisect_reset.assert_called_once()
+
+
+class TestBisectRunnerParallel(_RunnerTestCase):
+    """Tests for parallel bisect."""
+
+    COMMITS = [f"c{i}" for i in range(1, 11)]
+    GIT_RETURN_VALUES = {"resolve_refs": ["c1", "c10"]}
+
+    def setUp(self):
+        super().setUp()
+        self.mock_git.list_commits.side_effect = self._list_commits
+
+    def _list_commits(self, tip, exclude):
+        """Simulate rev-list on a linear history c1..c10."""
+        start = max(self.COMMITS.index(c) for c in exclude) + 1
+        return self.COMMITS[start : self.COMMITS.index(tip) + 1]
+
+    def test_parallel_finds_first_bad(self):
+        """run_bisect_parallel narrows the range to the first bad commit."""
+        runner = BisectRunner(
+            repo_path="/repo",
+            good_commit="c1",
+            bad_commit="c10",
+            test_script="./test.sh",
+            jobs=3,
+        )
+        runner.worktree_path = "/wt/0"
+        runner.extra_worktree_paths = ["/wt/1", "/wt/2"]
+
+        tested = []
+
+        def fake_test(commit, work_dir):
+            tested.append(commit)
+            return 1 if self.COMMITS.index(commit) >= 6 else 0
+
+        with patch.object(runner, "_run_test_script", side_effect=fake_test):
+            result = runner.run_bisect_parallel()
+
+        self.assertTrue(runner.use_worktree)
+        self.assertEqual(result, "c7")
+        self.assertLess(len(tested), len(self.COMMITS))
+
+    def test_parallel_abandons_out_of_range_tests(self):
+        """A slow test is stopped once its commit falls out of the range."""
+        runner = BisectRunner(
+            repo_path="/repo",
+            good_commit="c1",
+            bad_commit="c10",
+            test_script="./test.sh",
+            jobs=2,
+        )
+        runner.worktree_path = "/wt/0"
+        runner.extra_worktree_paths = ["/wt/1"]
+
+        def fake_test(commit, work_dir):
+            if commit == "c7":
+                # Hang until the runner gives up on this commit
+                deadline = time.monotonic() + 5
+                while commit not in runner._abandoned:
+                    if time.monotonic() > deadline:
+                        raise AssertionError("c7 was never abandoned")
+                    time.sleep(0.01)
+                return None
+            return 1 if self.COMMITS.index(commit) >= 2 else 0
+
+        with patch.object(runner, "_run_test_script", side_effect=fake_test):
+            result = runner.run_bisect_parallel()
+
+        self.assertEqual(result, "c3")
+        self.assertIn("c7", runner._abandoned)
+
+    def test_parallel_only_skipped_left(self):
+        """run_bisect_parallel gives up when only skipped commits remain."""
+        runner = BisectRunner(
+            repo_path="/repo",
+            good_commit="c1",
+            bad_commit="c10",
+            test_script="./test.sh",
+            jobs=2,
+        )
+        runner.worktree_path = "/wt/0"
+        runner.extra_worktree_paths = ["/wt/1"]
 
-            self.assertTrue(runner.validate())
+        with patch.object(runner, "_run_test_script", return_value=125):
+            self.assertIsNone(runner.run_bisect_parallel())
 
 
 if __name__ == "__main__":
@@ -1,77 +1,118 @@
 """Tests for CLI argument parsing."""
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from git_bisect_tool.cli import create_parser, main
 
+REQUIRED = ["--good", "abc123", "--test", "./test.sh"]
+
+DEFAULTS = {
+    "repo": ".",
+    "bad": "HEAD",
+    "branch": None,
+    "worktree": False,
+    "show_ancestry": False,
+    "dry_run": False,
+    "verbose": False,
+    "jobs": 1,
+}
+
+# (argv, expected attributes of the parsed namespace)
+PARSE_CASES = [
+    (REQUIRED, {"good": "abc123", "test": "./test.sh", **DEFAULTS}),
+    (["-g", "abc123", "-t", "./test.sh"], {"good": "abc123", "test": "./test.sh"}),
+    (
+        [
+            *REQUIRED,
+            "--repo",
+            "/path/to/repo",
+            "--branch",
+            "main",
+            "--bad",
+            "def456",
+            "--worktree",
+            "--show-ancestry",
+            "--dry-run",
+            "--verbose",
+            "--jobs",
+            "4",
+        ],
+        {
+            "repo": "/path/to/repo",
+            "branch": "main",
+            "bad": "def456",
+            "worktree": True,
+            "show_ancestry": True,
+            "dry_run": True,
+            "verbose": True,
+            "jobs": 4,
+        },
+    ),
+]
+
 
 class TestCreateParser(unittest.TestCase):
     """Tests for argument parser creation."""
 
-    def setUp(self):
-        self.parser = create_parser()
-
-    def test_required_args_good_and_test(self):
-        """--good and --test are required."""
-        args = self.parser.parse_args(["--good", "abc123", "--test", "./test.sh"])
-        self.assertEqual(args.good, "abc123")
-        self.assertEqual(args.test, "./test.sh")
-
-    def test_short_args(self):
-        """Short argument forms work."""
-        args = self.parser.parse_args(["-g", "abc123", "-t", "./test.sh"])
-        self.assertEqual(args.good, "abc123")
-        self.assertEqual(args.test, "./test.sh")
-
-    def test_default_values(self):
-        """Default values are set correctly."""
-        args = self.parser.parse_args(["--good", "abc", "--test", "./t.sh"])
-        self.assertEqual(args.repo, ".")
-        self.assertEqual(args.bad, "HEAD")
-        self.assertIsNone(args.branch)
-        self.assertFalse(args.worktree)
-        self.assertFalse(args.show_ancestry)
-        self.assertFalse(args.dry_run)
-        self.assertFalse(args.verbose)
-
-    def test_all_optional_args(self):
-        """All optional arguments can be set."""
-        args = self.parser.parse_args(
-            [
-                "--good",
-                "abc123",
-                "--test",
-                "./test.sh",
-                "--repo",
-                "/path/to/repo",
-                "--branch",
-                "main",
-                "--bad",
-                "def456",
-                "--worktree",
-                "--show-ancestry",
-                "--dry-run",
-                "--verbose",
-            ]
-        )
-        self.assertEqual(args.repo, "/path/to/repo")
-        self.assertEqual(args.branch, "main")
-        self.assertEqual(args.bad, "def456")
-        self.assertTrue(args.worktree)
-        self.assertTrue(args.show_ancestry)
-        self.assertTrue(args.dry_run)
-        self.assertTrue(args.verbose)
-
-    def test_missing_good_errors(self):
-        """Missing --good causes error."""
-        with self.assertRaises(SystemExit):
-            self.parser.parse_args(["--test", "./test.sh"])
-
-    def test_missing_test_errors(self):
-        """Missing --test causes error."""
-        with self.assertRaises(SystemExit):
-            self.parser.parse_args(["--good", "abc123"])
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_parser()
+
+    def test_parsing(self):
+        """Arguments, short forms, and defaults parse as expected."""
+        for argv, expected in PARSE_CASES:
+            with self.subTest(argv=argv):
+                args = self.parser.parse_args(argv)
+                for attr, value in expected.items():
+                    self.assertEqual(getattr(args, attr), value, attr)
+
+    def test_missing_required_errors(self):
+        """Missing --good or --test causes error."""
+        for argv in (["--test", "./test.sh"], ["--good", "abc123"]):
+            with self.subTest(argv=argv), patch("sys.stderr"):
+                with self.assertRaises(SystemExit):
+                    self.parser.parse_args(argv)
+
+
+# (argv, expected BisectRunner keyword arguments, run() return code)
+MAIN_CASES = [
+    (
+        ["--good", "abc", "--test", "./test.sh", "--verbose"],
+        {"good_commit": "abc", "test_script": "./test.sh", "verbose": True},
+        0,
+    ),
+    (
+        [
+            "--good",
+            "abc",
+            "--test",
+            "./test.sh",
+            "--repo",
+            "/repo",
+            "--branch",
+            "dev",
+            "--bad",
+            "def",
+            "--worktree",
+            "--show-ancestry",
+            "--dry-run",
+            "--jobs",
+            "2",
+        ],
+        {
+            "repo_path": "/repo",
+            "branch": "dev",
+            "bad_commit": "def",
+            "use_worktree": True,
+            "show_ancestry": True,
+            "dry_run": True,
+            "jobs": 2,
+        },
+        0,
+    ),
+    (["--good", "abc", "--test", "./test.sh"], {"good_commit": "abc"}, 1),
+]
 
 
 class TestMain(unittest.TestCase):
@@ -80,54 +121,26 @@ class TestMain(unittest.TestCase):
     @patch("git_bisect_tool.cli.BisectRunner")
     @patch("git_bisect_tool.cli.Colors")
     def test_main_creates_runner(self, mock_colors, mock_runner_class):
-        """main() creates BisectRunner with correct args."""
-        mock_runner = MagicMock()
-        mock_runner.run.return_value = 0
-        mock_runner_class.return_value = mock_runner
+        """main() passes CLI options to BisectRunner and returns its result."""
+        for argv, expected, returncode in MAIN_CASES:
+            with self.subTest(argv=argv):
+                mock_runner_class.reset_mock()
+                mock_runner_class.return_value.run.return_value = returncode
 
-        result = main(["--good", "abc", "--test", "./test.sh", "--verbose"])
+                self.assertEqual(main(argv), returncode)
 
-        self.assertEqual(result, 0)
-        mock_runner_class.assert_called_once()
-        call_kwargs = mock_runner_class.call_args[1]
-        self.assertEqual(call_kwargs["good_commit"], "abc")
-        self.assertEqual(call_kwargs["test_script"], "./test.sh")
-        self.assertTrue(call_kwargs["verbose"])
+                mock_runner_class.assert_called_once()
+                call_kwargs = mock_runner_class.call_args[1]
+                for name, value in expected.items():
+                    self.assertEqual(call_kwargs[name], value, name)
 
     @patch("git_bisect_tool.cli.BisectRunner")
     @patch("git_bisect_tool.cli.Colors")
-    def test_main_passes_all_options(self, mock_colors, mock_runner_class):
-        """main() passes all CLI options to BisectRunner."""
-        mock_runner = MagicMock()
-        mock_runner.run.return_value = 0
-        mock_runner_class.return_value = mock_runner
-
-        result = main(
-            [
-                "--good",
-                "abc",
-                "--test",
-                "./test.sh",
-                "--repo",
-                "/repo",
-                "--branch",
-                "dev",
-                "--bad",
-                "def",
-                "--worktree",
-                "--show-ancestry",
-                "--dry-run",
-            ]
-        )
-
-        self.assertEqual(result, 0)
-        call_kwargs = mock_runner_class.call_args[1]
-        self.assertEqual(call_kwargs["repo_path"], "/repo")
-        self.assertEqual(call_kwargs["branch"], "dev")
-        self.assertEqual(call_kwargs["bad_commit"], "def")
-        self.assertTrue(call_kwargs["use_worktree"])
-        self.assertTrue(call_kwargs["show_ancestry"])
-        self.assertTrue(call_kwargs["dry_run"])
+    def test_invalid_jobs_errors(self, mock_colors, mock_runner_class):
+        """--jobs below 1 causes error."""
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            main(["--good", "abc", "--test", "./t.sh", "--jobs", "0"])
+        mock_runner_class.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -10,17 +10,39 @@ from git_bisect_tool.colors import Colors
 class TestColors(unittest.TestCase):
     """Tests for Colors class."""
 
-    def setUp(self):
-        """Save original color values before each test."""
-        self._saved = {attr: getattr(Colors, attr) for attr in Colors._COLOR_ATTRS}
+    @classmethod
+    def setUpClass(cls):
+        """Save original color values once for the class."""
+        cls._saved = tuple(
+            (attr, getattr(Colors, attr)) for attr in Colors._COLOR_ATTRS
+        )
 
     def tearDown(self):
         """Restore original color values after each test."""
-        for attr, value in self._saved.items():
+        for attr, value in self._saved:
             setattr(Colors, attr, value)
 
     def test_color_codes_defined(self):
         """All expected color codes are defined as non-empty strings."""
+        self.assertSetEqual(
+            set(Colors._COLOR_ATTRS),
+            {
+                "RESET",
+                "BOLD",
+                "DIM",
+                "RED",
+                "GREEN",
+                "YELLOW",
+                "BLUE",
+                "MAGENTA",
+                "CYAN",
+                "WHITE",
+                "BG_RED",
+                "BG_GREEN",
+                "BG_YELLOW",
+                "BG_BLUE",
+            },
+        )
         for attr in Colors._COLOR_ATTRS:
             self.assertTrue(hasattr(Colors, attr))
             self.assertIsInstance(getattr(Colors, attr), str)
@@ -1,22 +1,62 @@
 """Tests for Git wrapper."""
 
+import io
+import signal
 import subprocess
 import unittest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import call, patch, MagicMock
 
 from git_bisect_tool.git import Git, GitError
 
+REPO = "/path/to/repo"
 
-class TestGitRun(unittest.TestCase):
-    """Tests for the run() method."""
+# argv prefix of every git command run against the test repository
+GIT_PREFIX = ["git", "-C", REPO]
+
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+COMMIT_BODY = (
+    b"tree " + b"b" * 40 + b"\n"
+    b"author John Doe <john@example.com> 1735732800 +0100\n"
+    b"committer John Doe <john@example.com> 1735732800 +0100\n"
+    b"\n"
+    b"Fix bug\n\nLonger description.\n"
+)
+
+# What `git cat-file --batch` prints for a request for COMMIT_SHA
+COMMIT_INFO_STDOUT = (
+    f"{COMMIT_SHA} commit {len(COMMIT_BODY)}\n".encode() + COMMIT_BODY + b"\n"
+)
+
+
+class _GitTestCase(unittest.TestCase):
+    """Base for Git tests, with a mock runner in place of subprocess.run.
+
+    self.mock_run is reset before each test, which sets the return_value or
+    side_effect it needs. self.git is shared by the class, so tests must not
+    leave state on it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_run = MagicMock()
+        cls.git = Git(REPO, runner=cls.mock_run)
 
     def setUp(self):
-        self.git = Git("/path/to/repo")
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+
+    def assert_cmd_contains(self, cmd: list[str], *tokens: str):
+        """Assert that every token appears somewhere in cmd."""
+        self.assertGreaterEqual(set(cmd), set(tokens), cmd)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_run_success(self, mock_run):
+
+class TestGitRun(_GitTestCase):
+    """Tests for the run() method."""
+
+    def test_run_success(self):
         """run() executes git command and returns result."""
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = SimpleNamespace(
             stdout="output\n",
             stderr="",
             returncode=0,
@@ -24,231 +64,451 @@ class TestGitRun(unittest.TestCase):
 
         result = self.git.run("status")
 
-        mock_run.assert_called_once()
-        cmd = mock_run.call_args[0][0]
-        self.assertEqual(cmd, ["git", "-C", "/path/to/repo", "status"])
+        self.mock_run.assert_called_once()
+        cmd = self.mock_run.call_args[0][0]
+        self.assertEqual(cmd, [*GIT_PREFIX, "status"])
+        self.assertEqual(result.stdout, "output\n")
+        self.assertEqual(self.mock_run.call_args[1]["encoding"], "utf-8")
+        self.assertEqual(self.mock_run.call_args[1]["errors"], "replace")
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_run_with_cwd(self, mock_run):
+    def test_run_with_cwd(self):
         """run() uses provided cwd instead of repo_path."""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+        self.mock_run.return_value = SimpleNamespace(stdout="", returncode=0)
 
         self.git.run("status", cwd="/other/path")
 
-        cmd = mock_run.call_args[0][0]
+        cmd = self.mock_run.call_args[0][0]
         self.assertEqual(cmd, ["git", "-C", "/other/path", "status"])
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_run_failure_raises(self, mock_run):
+    def test_run_failure_raises(self):
         """run() raises GitError on failure when check=True."""
-        mock_run.side_effect = subprocess.CalledProcessError(
+        self.mock_run.side_effect = subprocess.CalledProcessError(
             1, "git", stderr="error message"
         )
 
         with self.assertRaises(GitError):
             self.git.run("bad-command")
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_run_failure_no_raise(self, mock_run):
+    def test_run_silent_failure_includes_stderr(self):
+        """run_silent() still reports git's stderr on failure."""
+        self.mock_run.side_effect = subprocess.CalledProcessError(
+            1, "git", stderr="fatal: bad revision"
+        )
+
+        with self.assertRaisesRegex(GitError, "fatal: bad revision"):
+            self.git.run_silent("bisect", "start", "bad", "good")
+
+    def test_run_failure_no_raise(self):
         """run() does not raise when check=False."""
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="")
+        self.mock_run.return_value = SimpleNamespace(returncode=1, stdout="", stderr="")
 
         result = self.git.run("command", check=False)
 
         self.assertEqual(result.returncode, 1)
 
+    @patch("git_bisect_tool.git.sys.stdout")
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_run_streaming(self, mock_popen, mock_stdout):
+        """run_streaming echoes and reports each output line."""
+        proc = mock_popen.return_value
+        proc.__enter__.return_value = proc
+        proc.stdout = iter(["one\n", "two\n"])
+        proc.returncode = 3
 
-class TestGitQueries(unittest.TestCase):
-    """Tests for query methods."""
+        lines = []
+        result = self.git.run_streaming("bisect", "run", "x", on_line=lines.append)
+
+        self.assertEqual(result, 3)
+        self.assertEqual(lines, ["one\n", "two\n"])
+        self.assertEqual(
+            mock_stdout.write.call_args_list, [call("one\n"), call("two\n")]
+        )
+        cmd = mock_popen.call_args[0][0]
+        self.assertEqual(cmd, [*GIT_PREFIX, "bisect", "run", "x"])
+        self.assertEqual(mock_popen.call_args.kwargs["encoding"], "utf-8")
+
+    @patch("git_bisect_tool.git.os.killpg")
+    @patch("git_bisect_tool.git.sys.stdout")
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_run_streaming_interrupt(self, mock_popen, mock_stdout, mock_killpg):
+        """run_streaming stops git's process group when interrupted."""
+        proc = mock_popen.return_value
+        proc.__enter__.return_value = proc
+        proc.stdout = MagicMock()
+        proc.stdout.__iter__.side_effect = KeyboardInterrupt
+        proc.pid = 4242
+        proc.returncode = None
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.git.run_streaming("bisect", "run", "x", on_line=print)
+
+        mock_killpg.assert_called_once_with(4242, signal.SIGTERM)
+        self.assertTrue(mock_popen.call_args[1]["start_new_session"])
+
+
+class TestGitCatFile(_GitTestCase):
+    """Tests for lookups served by the cat-file process.
+
+    These start cat-file and fill the caches, so each test gets its own Git.
+    """
 
     def setUp(self):
-        self.git = Git("/path/to/repo")
+        super().setUp()
+        self.git = Git(REPO, runner=self.mock_run)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_get_commit_hash(self, mock_run):
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_hash(self, mock_popen):
         """get_commit_hash returns full hash."""
-        mock_run.return_value = MagicMock(
-            stdout="abc123def456\n",
-            returncode=0,
+        sha = "a" * 40
+        mock_popen.return_value.stdout = io.BytesIO(
+            f"{sha} commit 5\nbody\n\n".encode()
         )
 
         result = self.git.get_commit_hash("HEAD")
 
-        self.assertEqual(result, "abc123def456")
+        self.assertEqual(result, sha)
+        mock_popen.return_value.stdin.write.assert_called_once_with(b"HEAD^{commit}\n")
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_get_commit_info(self, mock_run):
-        """get_commit_info returns typed commit details."""
-        mock_run.return_value = MagicMock(
-            stdout="abc123\nabc\nFix bug\nJohn Doe\njohn@example.com\n2025-01-01 12:00:00\n",
-            returncode=0,
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_resolve_refs(self, mock_popen):
+        """resolve_refs resolves each ref through one cat-file process."""
+        mock_popen.return_value.stdout = io.BytesIO(
+            f"{'a' * 40} commit 0\n\n{'c' * 40} commit 0\n\n".encode()
         )
 
-        result = self.git.get_commit_info("abc123")
+        result = self.git.resolve_refs("good", "bad")
+
+        self.assertEqual(result, ["a" * 40, "c" * 40])
+        mock_popen.assert_called_once()
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_resolve_refs_skips_known_hashes(self, mock_popen):
+        """resolve_refs does not look up a full hash it has already seen."""
+        sha = "a" * 40
+        mock_popen.return_value.stdout = io.BytesIO(f"{sha} commit 0\n\n".encode())
+
+        self.git.resolve_refs("main")
+        result = self.git.resolve_refs(sha, sha)
+
+        self.assertEqual(result, [sha, sha])
+        mock_popen.return_value.stdin.write.assert_called_once()
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_hash_cached(self, mock_popen):
+        """get_commit_hash looks up a full hash once but HEAD every time."""
+        sha = "a" * 40
+        mock_popen.return_value.stdout = io.BytesIO(
+            f"{sha} commit 0\n\n{sha} commit 0\n\n".encode()
+        )
 
-        self.assertEqual(result["hash"], "abc123")
-        self.assertEqual(result["short_hash"], "abc")
+        self.git.get_commit_hash(sha)
+        self.git.get_commit_hash(sha)
+        self.git.get_commit_hash("HEAD")
+
+        self.assertEqual(
+            mock_popen.return_value.stdin.write.call_args_list,
+            [call(f"{sha}^{{commit}}\n".encode()), call(b"HEAD^{commit}\n")],
+        )
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info(self, mock_popen):
+        """get_commit_info parses the commit object from cat-file."""
+        mock_popen.return_value.stdout = io.BytesIO(COMMIT_INFO_STDOUT)
+
+        result = self.git.get_commit_info("HEAD")
+
+        self.assertEqual(result["hash"], COMMIT_SHA)
+        self.assertEqual(result["short_hash"], "0123456789ab")
         self.assertEqual(result["subject"], "Fix bug")
         self.assertEqual(result["author_name"], "John Doe")
         self.assertEqual(result["author_email"], "john@example.com")
+        self.assertEqual(result["author_date"], "2025-01-01 13:00:00 +0100")
+        mock_popen.return_value.stdin.write.assert_called_once_with(b"HEAD^{commit}\n")
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info_encoding(self, mock_popen):
+        """get_commit_info decodes with the commit's encoding header."""
+        body = (
+            b"tree " + b"b" * 40 + b"\n"
+            b"author Jos\xe9 <jose@example.com> 1735732800 +0100\n"
+            b"committer Jos\xe9 <jose@example.com> 1735732800 +0100\n"
+            b"encoding ISO-8859-1\n"
+            b"\n"
+            b"Fix caf\xe9\n"
+        )
+        mock_popen.return_value.stdout = io.BytesIO(
+            f"{COMMIT_SHA} commit {len(body)}\n".encode() + body + b"\n"
+        )
+
+        result = self.git.get_commit_info("HEAD")
+
+        self.assertEqual(result["subject"], "Fix caf\xe9")
+        self.assertEqual(result["author_name"], "Jos\xe9")
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info_without_author(self, mock_popen):
+        """A commit with no author line yields empty author fields."""
+        body = b"tree " + b"b" * 40 + b"\n\nFix bug\n"
+        mock_popen.return_value.stdout = io.BytesIO(
+            f"{COMMIT_SHA} commit {len(body)}\n".encode() + body + b"\n"
+        )
+
+        result = self.git.get_commit_info("HEAD")
+
+        self.assertEqual(result["subject"], "Fix bug")
+        self.assertEqual(result["author_name"], "")
+        self.assertEqual(result["author_email"], "")
+        self.assertEqual(result["author_date"], "")
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info_cached(self, mock_popen):
+        """get_commit_info answers repeated full-hash lookups from its cache."""
+        mock_popen.return_value.stdout = io.BytesIO(COMMIT_INFO_STDOUT)
+
+        first = self.git.get_commit_info("HEAD")
+        second = self.git.get_commit_info(COMMIT_SHA)
+
+        self.assertEqual(first, second)
+        mock_popen.return_value.stdin.write.assert_called_once()
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_context_manager_closes_cat_file(self, mock_popen):
+        """Leaving a Git context stops the cat-file process."""
+        mock_popen.return_value.stdout = io.BytesIO(f"{'a' * 40} commit 0\n\n".encode())
+
+        with Git(REPO) as git:
+            git.get_commit_hash("HEAD")
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_count_commits_between(self, mock_run):
+        mock_popen.return_value.__exit__.assert_called_once()
+        self.assertIsNone(git._cat_file)
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info_missing(self, mock_popen):
+        """get_commit_info raises GitError for an unknown ref."""
+        mock_popen.return_value.stdout = io.BytesIO(b"nope^{commit} missing\n")
+
+        with self.assertRaises(GitError):
+            self.git.get_commit_info("nope")
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_cat_file_exited(self, mock_popen):
+        """A cat-file process that exited raises GitError and is replaced."""
+        mock_popen.return_value.stdout = io.BytesIO(b"")
+
+        with self.assertRaises(GitError):
+            self.git.get_commit_info("HEAD")
+
+        mock_popen.return_value.stdout = io.BytesIO(COMMIT_INFO_STDOUT)
+        self.assertEqual(self.git.get_commit_info("HEAD")["hash"], COMMIT_SHA)
+        self.assertEqual(mock_popen.call_count, 2)
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_cat_file_broken_pipe(self, mock_popen):
+        """A write to a dead cat-file process raises GitError."""
+        mock_popen.return_value.stdin.write.side_effect = BrokenPipeError(32, "EPIPE")
+
+        with self.assertRaises(GitError):
+            self.git.get_commit_info("HEAD")
+
+        mock_popen.return_value.__exit__.assert_called_once()
+
+    @patch("git_bisect_tool.git.subprocess.Popen")
+    def test_get_commit_info_missing_ref_with_space(self, mock_popen):
+        """A missing ref whose name has a space still raises GitError."""
+        mock_popen.return_value.stdout = io.BytesIO(b"no such^{commit} missing\n")
+
+        with self.assertRaises(GitError):
+            self.git.get_commit_info("no such")
+
+
+class TestGitQueries(_GitTestCase):
+    """Tests for query methods."""
+
+    def test_count_commits_between(self):
         """count_commits_between returns integer count."""
-        mock_run.return_value = MagicMock(stdout="42\n", returncode=0)
+        self.mock_run.return_value = SimpleNamespace(stdout="42\n", returncode=0)
 
         result = self.git.count_commits_between("good", "bad")
 
         self.assertEqual(result, 42)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_is_ancestor_true(self, mock_run):
+    def test_count_left_right(self):
+        """count_left_right returns both sides of the symmetric difference."""
+        self.mock_run.return_value = SimpleNamespace(stdout="0\t42\n", returncode=0)
+
+        result = self.git.count_left_right("good", "bad")
+
+        self.assertEqual(result, (0, 42))
+        self.assert_cmd_contains(
+            self.mock_run.call_args[0][0],
+            "rev-list",
+            "--left-right",
+            "--count",
+            "good...bad",
+        )
+
+    def test_is_ancestor_true(self):
         """is_ancestor returns True when ancestor relationship exists."""
-        mock_run.return_value = MagicMock(returncode=0)
+        self.mock_run.return_value = SimpleNamespace(stdout="", returncode=0)
 
         result = self.git.is_ancestor("old", "new")
 
         self.assertTrue(result)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_is_ancestor_false(self, mock_run):
+    def test_is_ancestor_false(self):
         """is_ancestor returns False when no ancestor relationship."""
-        mock_run.return_value = MagicMock(returncode=1)
+        self.mock_run.return_value = SimpleNamespace(stdout="", returncode=1)
 
         result = self.git.is_ancestor("new", "old")
 
         self.assertFalse(result)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_get_current_branch(self, mock_run):
-        """get_current_branch returns branch name."""
-        mock_run.return_value = MagicMock(stdout="main\n", returncode=0)
-
-        result = self.git.get_current_branch()
-
-        self.assertEqual(result, "main")
-
-
-class TestGitBisect(unittest.TestCase):
-    """Tests for bisect-related methods."""
-
-    def setUp(self):
-        self.git = Git("/path/to/repo")
-
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_start(self, mock_run):
-        """bisect_start calls git bisect start with bad and good."""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
-
-        self.git.bisect_start("bad123", "good456")
-
-        cmd = mock_run.call_args[0][0]
-        self.assertIn("bisect", cmd)
-        self.assertIn("start", cmd)
-        self.assertIn("bad123", cmd)
-        self.assertIn("good456", cmd)
-
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_reset(self, mock_run):
-        """bisect_reset calls git bisect reset."""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
-
-        self.git.bisect_reset()
-
-        cmd = mock_run.call_args[0][0]
-        self.assertIn("bisect", cmd)
-        self.assertIn("reset", cmd)
-
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_estimate_from_stdout(self, mock_run):
-        """bisect_estimate parses step count from stdout."""
-        # First call: bisect start; second call: bisect reset
-        mock_run.side_effect = [
-            MagicMock(
-                stdout="Bisecting: 10 revisions left to test after this (roughly 3 steps)\n",
-                stderr="",
-                returncode=0,
+    def test_get_merge_ancestry(self):
+        """get_merge_ancestry extracts source branches from merge subjects."""
+        self.mock_run.return_value = SimpleNamespace(
+            stdout=(
+                "aaa111aaa111aaa1 Merge branch 'feature/x' into main\0"
+                "bbb222bbb222bbb2 Merge pull request #7 from user/fix\0"
+                "ccc333ccc333ccc3 Octopus\0"
+                "ddd444ddd444ddd4 Revert \"Merge branch 'y'\"\0"
             ),
-            MagicMock(stdout="", returncode=0),  # bisect reset
-        ]
-
-        result = self.git.bisect_estimate("bad", "good")
-
-        self.assertEqual(result, 3)
+            returncode=0,
+        )
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_estimate_from_stderr(self, mock_run):
-        """bisect_estimate parses step count from stderr."""
-        mock_run.side_effect = [
-            MagicMock(
-                stdout="",
-                stderr="Bisecting: 5 revisions left to test after this (roughly 2 steps)\n",
-                returncode=0,
-            ),
-            MagicMock(stdout="", returncode=0),  # bisect reset
-        ]
+        result = self.git.get_merge_ancestry("abc123", "main")
 
-        result = self.git.bisect_estimate("bad", "good")
+        self.assertEqual(
+            [entry["source_branch"] for entry in result],
+            ["feature/x", "user/fix", None, None],
+        )
+        self.assertEqual(result[0]["merge_commit"], "aaa111aaa111")
 
-        self.assertEqual(result, 2)
+        limited = self.git.get_merge_ancestry("abc123", "main", limit=2)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_estimate_singular_step(self, mock_run):
-        """bisect_estimate handles singular 'step'."""
-        mock_run.side_effect = [
-            MagicMock(
-                stdout="Bisecting: 1 revision left to test after this (roughly 1 step)\n",
-                stderr="",
-                returncode=0,
-            ),
-            MagicMock(stdout="", returncode=0),
-        ]
+        self.assertEqual(
+            [entry["merge_commit"] for entry in limited],
+            ["ccc333ccc333", "ddd444ddd444"],
+        )
 
-        result = self.git.bisect_estimate("bad", "good")
+    def test_get_current_branch(self):
+        """get_current_branch returns branch name."""
+        self.mock_run.return_value = SimpleNamespace(stdout="main\n", returncode=0)
 
-        self.assertEqual(result, 1)
+        result = self.git.get_current_branch()
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_bisect_estimate_returns_none_on_failure(self, mock_run):
-        """bisect_estimate returns None when output can't be parsed."""
-        mock_run.side_effect = [
-            MagicMock(stdout="", stderr="", returncode=1),
-            MagicMock(stdout="", returncode=0),
-        ]
+        self.assertEqual(result, "main")
 
-        result = self.git.bisect_estimate("bad", "good")
 
-        self.assertIsNone(result)
+# Commands whose output is discarded: (method, args, expected argv)
+SILENT_COMMAND_CASES = [
+    (
+        "bisect_start",
+        ("bad123", "good456"),
+        [*GIT_PREFIX, "bisect", "start", "bad123", "good456"],
+    ),
+    ("bisect_reset", (), [*GIT_PREFIX, "bisect", "reset"]),
+    (
+        "checkout",
+        ("abc123",),
+        [*GIT_PREFIX, "checkout", "--quiet", "--detach", "abc123"],
+    ),
+    (
+        "create_worktree",
+        ("/tmp/wt", "HEAD"),
+        [*GIT_PREFIX, "worktree", "add", "--detach", "/tmp/wt", "HEAD"],
+    ),
+    (
+        "remove_worktree",
+        ("/tmp/wt",),
+        [*GIT_PREFIX, "worktree", "remove", "--force", "/tmp/wt"],
+    ),
+]
+
+
+class TestGitSilentCommands(_GitTestCase):
+    """Tests for bisect, checkout, and worktree commands."""
+
+    def test_command_shapes(self):
+        """Each command runs the expected git argv with stdout discarded."""
+        for name, args, expected in SILENT_COMMAND_CASES:
+            with self.subTest(name=name):
+                self.mock_run.reset_mock()
+                self.mock_run.return_value = SimpleNamespace(stdout=None, returncode=0)
+
+                getattr(self.git, name)(*args)
+
+                self.assertEqual(self.mock_run.call_args[0][0], expected)
+                self.assertEqual(
+                    self.mock_run.call_args[1]["stdout"], subprocess.DEVNULL
+                )
+                self.assertEqual(self.mock_run.call_args[1]["stderr"], subprocess.PIPE)
+
+    def test_create_worktree_returns_path(self):
+        """create_worktree returns the worktree path."""
+        self.mock_run.return_value = SimpleNamespace(stdout=None, returncode=0)
+
+        self.assertEqual(self.git.create_worktree("/tmp/wt", "HEAD"), "/tmp/wt")
+
+
+class TestGitBisect(_GitTestCase):
+    """Tests for bisect-related methods."""
 
+    def test_get_bisect_bad(self):
+        """get_bisect_bad reads refs/bisect/bad."""
+        self.mock_run.return_value = SimpleNamespace(
+            stdout="abc123def456\n", returncode=0
+        )
 
-class TestGitWorktree(unittest.TestCase):
-    """Tests for worktree methods."""
+        result = self.git.get_bisect_bad(cwd="/tmp/wt")
 
-    def setUp(self):
-        self.git = Git("/path/to/repo")
+        self.assertEqual(result, "abc123def456")
+        self.assert_cmd_contains(
+            self.mock_run.call_args[0][0], "rev-parse", "--verify", "refs/bisect/bad"
+        )
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_create_worktree(self, mock_run):
-        """create_worktree calls git worktree add."""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+    def test_get_bisect_bad_no_session(self):
+        """get_bisect_bad returns None without a bisect session."""
+        self.mock_run.return_value = SimpleNamespace(stdout="", returncode=1)
 
-        result = self.git.create_worktree("/tmp/wt", "HEAD")
+        self.assertIsNone(self.git.get_bisect_bad())
 
-        self.assertEqual(result, "/tmp/wt")
-        cmd = mock_run.call_args[0][0]
-        self.assertIn("worktree", cmd)
-        self.assertIn("add", cmd)
 
-    @patch("git_bisect_tool.git.subprocess.run")
-    def test_remove_worktree(self, mock_run):
-        """remove_worktree calls git worktree remove."""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+class TestGitSubmodules(_GitTestCase):
+    """Tests for submodule methods."""
 
-        self.git.remove_worktree("/tmp/wt")
+    def test_get_submodule_paths(self):
+        """get_submodule_paths parses paths from .gitmodules."""
+        self.mock_run.return_value = SimpleNamespace(
+            stdout="submodule.a.path libs/a\nsubmodule.b.path third party/b\n",
+            returncode=0,
+        )
 
-        cmd = mock_run.call_args[0][0]
-        self.assertIn("worktree", cmd)
-        self.assertIn("remove", cmd)
+        result = self.git.get_submodule_paths(cwd="/tmp/wt")
+
+        self.assertEqual(result, ["libs/a", "third party/b"])
+
+    def test_init_submodule_with_reference(self):
+        """init_submodule passes --reference when given."""
+        self.mock_run.return_value = SimpleNamespace(stdout="", returncode=0)
+
+        self.git.init_submodule("libs/a", reference="/repo/libs/a", cwd="/tmp/wt")
+
+        cmd = self.mock_run.call_args[0][0]
+        self.assertEqual(
+            cmd,
+            [
+                "git",
+                "-C",
+                "/tmp/wt",
+                "submodule",
+                "update",
+                "--init",
+                "--reference",
+                "/repo/libs/a",
+                "--",
+                "libs/a",
+            ],
+        )
 
 
 if __name__ == "__main__":
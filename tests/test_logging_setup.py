@@ -0,0 +1,129 @@
+"""Tests for logging configuration."""
+
+import io
+import logging
+import sys
+import unittest
+
+from git_bisect_tool.colors import Colors
+from git_bisect_tool.logging_setup import ColoredFormatter
+
+
+def _record(level: int, msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestColoredFormatter(unittest.TestCase):
+    """Tests for ColoredFormatter."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Save original color values once for the class."""
+        cls._saved = tuple(
+            (attr, getattr(Colors, attr)) for attr in Colors._COLOR_ATTRS
+        )
+
+    def tearDown(self):
+        """Restore original color values after each test."""
+        for attr, value in self._saved:
+            setattr(Colors, attr, value)
+
+    def test_colors_level_and_warning_message(self):
+        """Level names are colored, and so are messages at WARNING and above."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s")
+
+        info = formatter.format(_record(logging.INFO, "step %d", 3))
+        warning = formatter.format(_record(logging.WARNING, "careful"))
+
+        self.assertEqual(info, f"{Colors.CYAN}INFO{Colors.RESET} step 3")
+        self.assertEqual(
+            warning,
+            f"{Colors.YELLOW}WARNING{Colors.RESET} "
+            f"{Colors.YELLOW}careful{Colors.RESET}",
+        )
+
+    def test_respects_disabled_colors(self):
+        """No escape codes are emitted once Colors.disable() has run."""
+        Colors.disable()
+        formatter = ColoredFormatter("%(levelname)s %(message)s")
+
+        output = formatter.format(_record(logging.ERROR, "failed"))
+
+        self.assertEqual(output, "ERROR failed")
+
+    def test_does_not_modify_record(self):
+        """The record is left untouched for other handlers."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s")
+        record = _record(logging.WARNING, "careful")
+
+        formatter.format(record)
+
+        self.assertEqual(record.levelname, "WARNING")
+        self.assertEqual(record.msg, "careful")
+
+    def test_second_handler_not_double_colored(self):
+        """Two colored handlers on one logger both see the plain record."""
+        logger = logging.getLogger("git-bisect-tool.test")
+        logger.propagate = False
+        self.addCleanup(logger.handlers.clear)
+        streams = [io.StringIO(), io.StringIO()]
+        for stream in streams:
+            handler = logging.StreamHandler(stream)
+            handler.setFormatter(ColoredFormatter("%(levelname)s %(message)s"))
+            logger.addHandler(handler)
+
+        logger.warning("careful")
+
+        expected = (
+            f"{Colors.YELLOW}WARNING{Colors.RESET} "
+            f"{Colors.YELLOW}careful{Colors.RESET}\n"
+        )
+        self.assertEqual([s.getvalue() for s in streams], [expected, expected])
+
+    def test_appends_exception(self):
+        """Exception tracebacks follow the message."""
+        Colors.disable()
+        formatter = ColoredFormatter("%(message)s")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+
+        output = formatter.format(record)
+
+        self.assertTrue(output.startswith("failed\nTraceback"))
+        self.assertIn("ValueError: boom", output)
+
+    def test_brace_style(self):
+        """Format strings in the other styles are honored."""
+        formatter = ColoredFormatter("{levelname}: {message}", style="{")
+
+        output = formatter.format(_record(logging.WARNING, "careful"))
+
+        self.assertEqual(
+            output,
+            f"{Colors.YELLOW}WARNING{Colors.RESET}: "
+            f"{Colors.YELLOW}careful{Colors.RESET}",
+        )
+
+    def test_caches_exception_text(self):
+        """The traceback is formatted once and cached on the record."""
+        formatter = ColoredFormatter("%(message)s")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+
+        first = formatter.format(record)
+        record.exc_info = None
+
+        self.assertIn("ValueError: boom", record.exc_text)
+        self.assertEqual(formatter.format(record), first)
+
+
+if __name__ == "__main__":
+    unittest.main()